@@ -0,0 +1,28 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.suite import CASES, run_suite
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the data pipeline at scaled sizes against local fixtures and a mocked yfinance")
+    parser.add_argument("--only", action="append", choices=list(CASES), help="run just this case (repeatable)")
+    parser.add_argument("--full", action="store_true", help="include the largest sizes (1M news rows, ...)")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated upstream latency per request (s)")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    args = parser.parse_args()
+
+    print(f"Running benchmarks ({'full' if args.full else 'quick'}, {args.latency * 1000:.0f} ms latency)")
+    results = run_suite(args.only, full=args.full, latency=args.latency)
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+        print(f"✅ Wrote {len(results)} results to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+from urllib.parse import quote_plus
+
+import feedparser
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.stub_server import StubServer
+from fetchers.feed_engine import fetch_feeds
+from fetchers import registry
+
+
+def serial_loop(urls):
+    # The original fetch_news loop: one blocking feedparser.parse per company
+    return [feedparser.parse(url).entries for url in urls]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs concurrent news feed fetching against a local stub")
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated upstream latency per request (s)")
+    parser.add_argument("--per-host", type=int, default=4)
+    args = parser.parse_args()
+
+    routes = {"/rss/search": ("google_news.rss", "application/rss+xml")}
+    with StubServer(routes, latency=args.latency) as stub:
+        urls = [f"{stub.base_url}/rss/search?q={quote_plus(q)}" for q in registry.news_queries().values()]
+
+        start = time.perf_counter()
+        serial_loop(urls)
+        serial = time.perf_counter() - start
+
+        state = {}
+        start = time.perf_counter()
+        fetch_feeds(urls, state, per_host=args.per_host)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = fetch_feeds(urls, state, per_host=args.per_host)
+        warm = time.perf_counter() - start
+        unchanged = sum(r["status"] == 304 for r in results.values())
+
+    print(f"{len(urls)} feeds, {args.latency * 1000:.0f} ms simulated latency, per-host limit {args.per_host}")
+    print(f"serial feedparser loop:      {serial:6.2f}s")
+    print(f"concurrent, cold:            {cold:6.2f}s  ({serial / cold:.1f}x)")
+    print(f"concurrent, conditional GET: {warm:6.2f}s  ({unchanged}/{len(urls)} answered 304)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+import time
+
+import yfinance as yf
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks import fake_yfinance
+from fetchers import registry
+from fetchers.fetch_quotes import fetch_quotes
+
+
+def serial_info_loop(tickers):
+    # The original fetch_live_data loop: one blocking .info call per ticker
+    return [yf.Ticker(t).info for t in tickers]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Market Overview cold-load latency against a mocked yfinance")
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated latency of one yfinance call (s)")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    tickers = registry.tickers()
+    with fake_yfinance.patched(latency=args.latency):
+        start = time.perf_counter()
+        serial_info_loop(tickers)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        quotes = fetch_quotes(tickers, max_workers=args.workers)
+        batched = time.perf_counter() - start
+
+    print(f"{len(tickers)} tickers, {args.latency * 1000:.0f} ms simulated latency per call")
+    print(f"serial .info loop:  {serial:6.2f}s")
+    print(f"fetch_quotes:       {batched:6.2f}s  ({serial / batched:.1f}x)")
+    print(quotes.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
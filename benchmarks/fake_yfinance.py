@@ -0,0 +1,72 @@
+import contextlib
+import time
+import zlib
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+
+def synthetic_history(tickers, days=252, seed=0):
+    # Random-walk OHLCV bars in the (field, ticker) column layout of yf.download(group_by="column")
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days, name="Date")
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, (days, len(tickers))), axis=0))
+    volumes = rng.integers(100_000, 5_000_000, (days, len(tickers))).astype("float64")
+    fields = {"Open": closes, "High": closes * 1.01, "Low": closes * 0.99,
+              "Close": closes, "Adj Close": closes, "Volume": volumes}
+    return pd.concat({f: pd.DataFrame(v, index=index, columns=tickers) for f, v in fields.items()}, axis=1)
+
+
+def synthetic_info(ticker):
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    return {
+        "regularMarketPrice": float(rng.uniform(10, 500)),
+        "regularMarketChangePercent": float(rng.normal(0, 1.5)),
+        "volume": int(rng.integers(100_000, 5_000_000)),
+        "marketCap": int(rng.integers(10**9, 10**11)),
+        "trailingPE": float(rng.uniform(8, 40)),
+        "52WeekChange": float(rng.normal(0.1, 0.2)),
+        "beta": float(rng.uniform(0.5, 1.5)),
+    }
+
+
+class FakeTicker:
+    def __init__(self, ticker, latency):
+        self.ticker = ticker
+        self.latency = latency
+
+    @property
+    def info(self):
+        time.sleep(self.latency)
+        return synthetic_info(self.ticker)
+
+    def history(self, period="1mo", start=None, **kwargs):
+        time.sleep(self.latency)
+        frame = synthetic_history([self.ticker]).xs(self.ticker, axis=1, level=1)
+        if start is not None:
+            frame = frame[frame.index >= pd.Timestamp(start)]
+        return frame
+
+
+@contextlib.contextmanager
+def patched(latency=0.3, download_latency=None):
+    """Replace yf.Ticker and yf.download with offline fakes that sleep like a slow upstream.
+
+    A batched download costs one round-trip (`download_latency`, default 2x `latency`)
+    regardless of how many symbols it carries.
+    """
+    download_latency = 2 * latency if download_latency is None else download_latency
+
+    def fake_download(tickers, start=None, **kwargs):
+        time.sleep(download_latency)
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        frame = synthetic_history(tickers)
+        if start is not None:
+            frame = frame[frame.index >= pd.Timestamp(start)]
+        return frame
+
+    with mock.patch.object(yf, "Ticker", lambda t: FakeTicker(t, latency)), \
+            mock.patch.object(yf, "download", fake_download):
+        yield
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class StubServer:
+    """Local HTTP server replaying recorded fixtures with an artificial upstream latency.
+
+    `routes` maps a path prefix to (fixture, content type), where the fixture is a file name or a
+    callable building the body from the request path. Every response carries a stable ETag so
+    conditional requests come back as 304 Not Modified.
+    """
+
+    def __init__(self, routes, latency=0.0):
+        self.routes = routes
+        self.latency = latency
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def body(self, fixture):
+        if fixture not in self._bodies:
+            with open(os.path.join(FIXTURES_DIR, fixture), "rb") as f:
+                self._bodies[fixture] = f.read()
+        return self._bodies[fixture]
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                time.sleep(stub.latency)
+
+                route = next((r for r in stub.routes if self.path.startswith(r)), None)
+                if route is None:
+                    self.send_error(404)
+                    return
+
+                fixture, content_type = stub.routes[route]
+                body = fixture(self.path) if callable(fixture) else stub.body(fixture)
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+                if self.headers.get("If-None-Match") == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
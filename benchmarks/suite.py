@@ -0,0 +1,221 @@
+import contextlib
+import os
+import re
+import shutil
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+import pandas as pd
+import pyarrow as pa
+from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+from streamlit.proto.ArrowData_pb2 import ArrowData
+
+from benchmarks import fake_yfinance
+from benchmarks.stub_server import FIXTURES_DIR, StubServer
+from fetchers import analytics, fetch_defense_news, news_store, price_cache, registry, stinger_index
+from fetchers.fetch_dod_contracts import fetch_dod_contracts
+from fetchers.fetch_quotes import fetch_quotes
+from streamlit_app.market_table import format_market_table, style_market_table
+
+NEWS_ROUTES = {"/rss/search": ("google_news.rss", "application/rss+xml")}
+
+
+def dod_listing_page(path):
+    """The listing fixture served as `?Page=N`, article ids shifted so every page lists new announcements."""
+    page = int(parse_qs(urlsplit(path).query).get("Page", ["1"])[0])
+    with open(os.path.join(FIXTURES_DIR, "dod_contracts_listing.html")) as f:
+        html = f.read()
+    return re.sub(r"(?<=/Article/)\d+", lambda m: str(int(m.group()) - 10 * (page - 1)), html).encode()
+
+
+DOD_ROUTES = {
+    "/News/Contracts/Contract/Article/": ("dod_contract_article.html", "text/html"),
+    "/News/Contracts/": (dod_listing_page, "text/html"),
+}
+
+# (quick sizes, extra sizes for --full)
+TICKER_SIZES = ([36, 500, 5000], [])
+NEWS_ROW_SIZES = ([150, 10_000, 100_000], [1_000_000])
+FEED_SIZES = ([29, 150], [500])
+PAGE_SIZES = ([1, 5], [20])
+
+
+@contextlib.contextmanager
+def scratch_dir():
+    # The fetchers write to relative data/ paths, so each run gets its own working directory
+    cwd = os.getcwd()
+    path = tempfile.mkdtemp(prefix="stinger-bench-")
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def synthetic_tickers(n):
+    tickers = registry.tickers()[:n]
+    return tickers + [f"SYN{i:05d}" for i in range(n - len(tickers))]
+
+
+def synthetic_news(rows):
+    # Fixture headlines cycled across companies, with unique links so every row is a new story
+    titles = [
+        "US Army awards Lockheed record $9.8 billion missile contract - Defense News",
+        "Northrop Grumman radar upgrade wins $450M Air Force order",
+        "BAE Systems shipbuilding backlog grows on new frigate deal",
+        "Saab drone and satellite partnership announced",
+        "Rheinmetall quarterly results beat estimates",
+    ]
+    companies = registry.companies()["name"].tolist()
+    published = pd.date_range(end="2025-09-01", periods=rows, freq="37min", tz="UTC")
+    return pd.DataFrame({
+        "company": [companies[i % len(companies)] for i in range(rows)],
+        "title": [titles[i % len(titles)] for i in range(rows)],
+        "link": [f"https://example.com/article/{i}" for i in range(rows)],
+        "published": published.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+    })
+
+
+def bench_fetch_news(feeds, latency, stack):
+    queries = {f"Company {i}": f"Company {i} defense" for i in range(feeds)}
+    stub = stack.enter_context(StubServer(NEWS_ROUTES, latency=latency))
+
+    def run():
+        # Cold run: empty feed state, so every feed is a full 200 response
+        with scratch_dir(), contextlib.redirect_stdout(None), \
+                mock.patch.object(fetch_defense_news, "feed_url",
+                                  lambda q: f"{stub.base_url}/rss/search?q={quote_plus(q)}"):
+            fetch_defense_news.fetch_news(queries)
+
+    return run, feeds
+
+
+def bench_news_store(rows, latency, stack):
+    items = synthetic_news(rows).to_dict("records")
+
+    def run():
+        with scratch_dir():
+            news_store.upsert_news(items)
+            news_store.load_news()
+
+    return run, rows
+
+
+def bench_fetch_dod_contracts(pages, latency, stack):
+    stub = stack.enter_context(StubServer(DOD_ROUTES, latency=latency))
+
+    def run():
+        with scratch_dir(), contextlib.redirect_stdout(None):
+            fetch_dod_contracts(max_pages=pages, interval=0, listing_url=f"{stub.base_url}/News/Contracts/",
+                                path="data/dod_contracts.csv")
+
+    return run, pages
+
+
+def bench_fetch_live_data(tickers, latency, stack):
+    symbols = synthetic_tickers(tickers)
+    companies = pd.DataFrame({"Company": [f"{t} Corp" for t in symbols], "Ticker": symbols})
+
+    def run():
+        # Same work as fetch_live_data in streamlit_app/app.py, minus the Refresher snapshot
+        with fake_yfinance.patched(latency=latency):
+            quotes = fetch_quotes(symbols)
+        df = companies.merge(quotes.drop(columns=["Beta"]), on="Ticker", how="inner")
+        format_market_table(df)
+
+    return run, tickers
+
+
+def bench_stinger_index(tickers, latency, stack):
+    symbols = synthetic_tickers(tickers)
+    bars = fake_yfinance.synthetic_history(symbols, days=252 * 5)
+    histories = {t: bars.xs(t, axis=1, level=1) for t in symbols}
+    market_caps = {t: fake_yfinance.synthetic_info(t)["marketCap"] for t in symbols}
+
+    def run():
+        closes = stinger_index.align_closes(histories)
+        for weighting in stinger_index.WEIGHTINGS:
+            stinger_index.compute_index(closes, weighting, market_caps)
+
+    return run, tickers
+
+
+def bench_analytics(tickers, latency, stack):
+    symbols = synthetic_tickers(tickers)
+    bars = fake_yfinance.synthetic_history(symbols, days=252 * 5)
+    closes = analytics.close_matrix({t: bars.xs(t, axis=1, level=1) for t in symbols})
+    benchmarks = {"Benchmark": symbols[0]}
+
+    def run():
+        for horizon in analytics.HORIZONS:
+            analytics.compute_analytics(price_cache.slice_period(closes, horizon), symbols, benchmarks)
+
+    return run, tickers
+
+
+def bench_render_table(tickers, latency, stack):
+    symbols = synthetic_tickers(tickers)
+    quotes = pd.DataFrame([fake_yfinance.synthetic_info(t) for t in symbols])
+    df = pd.DataFrame({
+        "Company": [f"{t} Corp" for t in symbols], "Ticker": symbols,
+        "Price": quotes["regularMarketPrice"], "Change %": quotes["regularMarketChangePercent"],
+        "Volume": quotes["volume"], "Market Cap": quotes["marketCap"],
+        "P/E Ratio": quotes["trailingPE"], "52W Change": quotes["52WeekChange"],
+    })
+
+    def run():
+        # st.dataframe ships the numeric table to the browser as Arrow, plus the Styler's CSS;
+        # number formatting happens there
+        table = format_market_table(df)
+        pa.Table.from_pandas(table, preserve_index=False)
+        marshall_styler(ArrowData(), style_market_table(table), "bench")
+
+    return run, tickers
+
+
+# name: (setup(size, latency, stack) -> (run, items), sizes, unit). Servers and other fixtures a
+# setup needs go on the ExitStack, so they are started before and torn down after the timed runs.
+CASES = {
+    "fetch_news": (bench_fetch_news, FEED_SIZES, "feeds"),
+    "news_store": (bench_news_store, NEWS_ROW_SIZES, "rows"),
+    "fetch_dod_contracts": (bench_fetch_dod_contracts, PAGE_SIZES, "pages"),
+    "fetch_live_data": (bench_fetch_live_data, TICKER_SIZES, "tickers"),
+    "stinger_index": (bench_stinger_index, TICKER_SIZES, "tickers"),
+    "analytics": (bench_analytics, TICKER_SIZES, "tickers"),
+    "render_table": (bench_render_table, TICKER_SIZES, "tickers"),
+}
+
+
+def measure(run):
+    """Wall time of one run, then peak traced memory of a second run (tracing slows it down)."""
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run_suite(names=None, full=False, latency=0.05):
+    rows = []
+    for name, (setup, (quick, extra), unit) in CASES.items():
+        if names and name not in names:
+            continue
+        for size in quick + (extra if full else []):
+            with contextlib.ExitStack() as stack:
+                run, items = setup(size, latency, stack)
+                seconds, peak = measure(run)
+            rows.append({"case": name, "size": size, "unit": unit, "seconds": seconds,
+                         "items/s": items / seconds, "peak MB": peak / 2**20})
+            print(f"  {name:<20} {size:>9,} {unit:<8} {seconds:8.3f}s  {items / seconds:12,.0f}/s  "
+                  f"{peak / 2**20:8.1f} MB", flush=True)
+    return pd.DataFrame(rows, columns=["case", "size", "unit", "seconds", "items/s", "peak MB"])
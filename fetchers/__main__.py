@@ -0,0 +1,32 @@
+import argparse
+import sys
+
+from fetchers.orchestrator import JOBS, run_daemon, run_once
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m fetchers", description="Run the Stinger Defence data jobs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run jobs once, in parallel, and exit")
+    run.add_argument("jobs", nargs="*", metavar="JOB", help=f"jobs to run (default: all of {', '.join(JOBS)})")
+    run.add_argument("--workers", type=int, help="parallel jobs (default: one per job)")
+    run.add_argument("--processes", action="store_true", help="run each job in its own process")
+
+    daemon = commands.add_parser("daemon", help="keep running, each job on its own interval")
+    daemon.add_argument("--workers", type=int, help="parallel jobs (default: one per job)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        unknown = [job for job in args.jobs if job not in JOBS]
+        if unknown:
+            parser.error(f"unknown job(s): {', '.join(unknown)}")
+        sys.exit(1 if run_once(args.jobs, args.workers, args.processes) else 0)
+    try:
+        run_daemon(args.workers)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
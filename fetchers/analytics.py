@@ -0,0 +1,144 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fetchers import metrics, price_cache, registry
+from fetchers.atomic import replacing
+
+ANALYTICS_DIR = "data/analytics"
+# One trading day has no returns to measure, so "1d" is left out
+HORIZONS = ["5d", "1mo", "3mo", "6mo", "ytd", "1y", "2y", "5y", "10y", "max"]
+TRADING_DAYS = 252
+
+# Sector-wide statistics for every public company in the registry, precomputed per horizon
+# from the local price cache so the dashboard never loads N histories to rank or compare
+# them. Each horizon gets a summary (one row per ticker) and a correlation matrix.
+
+
+def close_matrix(histories):
+    """Date x ticker closes, forward-filled over each listing's exchange holidays.
+
+    Unlike stinger_index.align_closes, rows are not trimmed to dates every ticker shares,
+    so a recent listing does not shorten the history of the others.
+    """
+    closes = pd.concat({t: h["Close"] for t, h in histories.items() if not h.empty}, axis=1)
+    # copy() consolidates the per-ticker columns into one 2D block, so every later column-wise
+    # operation is a single numpy call rather than one call per ticker
+    return closes.sort_index().ffill().copy()
+
+
+def pairwise_moments(a, b):
+    """(covariance, correlation, variance of b) for every column of `a` against every column
+    of `b`, each pair over the dates both have returns for.
+
+    Same result as pandas' pairwise cov()/corr(), but as a few matrix products instead of a
+    loop over pairs, which is what makes a full-universe matrix affordable. Windows without
+    gaps (the usual case) take a single product.
+    """
+    x, y = a.to_numpy(dtype="float64"), b.to_numpy(dtype="float64")
+    if len(x) < 2:
+        empty = np.full((x.shape[1], y.shape[1]), np.nan)
+        return tuple(pd.DataFrame(empty, a.columns, b.columns) for _ in range(3))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if not (np.isnan(x).any() or np.isnan(y).any()):
+            x, y = x - x.mean(axis=0), y - y.mean(axis=0)
+            cross = x.T @ y
+            var_x, var_y = (x * x).sum(axis=0), (y * y).sum(axis=0)
+            cov = cross / (len(x) - 1)
+            corr = cross / np.sqrt(var_x)[:, None] / np.sqrt(var_y)
+            var_b = np.broadcast_to(var_y / (len(x) - 1), cross.shape)
+        else:
+            mx, my = ~np.isnan(x), ~np.isnan(y)
+            x, y = np.where(mx, x, 0.0), np.where(my, y, 0.0)
+            mx, my = mx.astype("float64"), my.astype("float64")
+            n = mx.T @ my
+            sum_x, sum_y = x.T @ my, mx.T @ y  # sums over the dates the other column is valid
+            cross = x.T @ y - sum_x * sum_y / n
+            var_x = (x * x).T @ my - sum_x ** 2 / n
+            var_y = mx.T @ (y * y) - sum_y ** 2 / n
+            cov = np.where(n >= 2, cross / (n - 1), np.nan)
+            corr = np.where(n >= 2, cross / np.sqrt(var_x * var_y), np.nan)
+            var_b = np.where(n >= 2, var_y / (n - 1), np.nan)
+    np.clip(corr, -1, 1, out=corr)
+    return tuple(pd.DataFrame(values, a.columns, b.columns) for values in (cov, corr, var_b))
+
+
+@metrics.timed("analytics.compute")
+def compute_analytics(closes, tickers, benchmarks):
+    """(summary, correlation) for `tickers` over the rows of `closes`.
+
+    The summary has the return, annualized volatility, maximum and current drawdown (all in
+    percent) and a beta against each of `benchmarks` ({name: ticker}). Every statistic is
+    computed for all columns at once; each ticker uses the dates it has prices for.
+    """
+    tickers = [t for t in tickers if t in closes.columns]
+    benchmarks = {name: t for name, t in benchmarks.items() if t in closes.columns}
+    returns = closes.pct_change(fill_method=None)
+    drawdown = closes / closes.cummax() - 1
+
+    summary = pd.DataFrame({
+        "Return %": (closes.iloc[-1] / closes.bfill().iloc[0] - 1) * 100,
+        "Volatility %": returns.std() * np.sqrt(TRADING_DAYS) * 100,
+        "Max Drawdown %": drawdown.min() * 100,
+        "Drawdown %": drawdown.iloc[-1] * 100,
+    }).reindex(tickers)
+
+    returns = returns.iloc[1:]
+    if benchmarks:
+        bench = returns[list(benchmarks.values())]
+        # Benchmark variance over the same dates as each covariance, so shorter histories get a true beta
+        cov, _, bench_var = pairwise_moments(returns[tickers], bench)
+        betas = cov / bench_var
+        betas.columns = [f"Beta {name}" for name in benchmarks]
+        summary = summary.join(betas)
+
+    summary.index.name = "Ticker"
+    _, correlation, _ = pairwise_moments(returns[tickers], returns[tickers])
+    return summary, correlation
+
+
+def summary_path(horizon, analytics_dir=ANALYTICS_DIR):
+    return os.path.join(analytics_dir, f"summary_{horizon}.csv")
+
+
+def correlation_path(horizon, analytics_dir=ANALYTICS_DIR):
+    return os.path.join(analytics_dir, f"correlation_{horizon}.csv")
+
+
+def load_analytics(horizon, analytics_dir=ANALYTICS_DIR):
+    """(summary, correlation) persisted for `horizon`, or None if the pipeline has not produced them."""
+    try:
+        summary = pd.read_csv(summary_path(horizon, analytics_dir), index_col="Ticker")
+        correlation = pd.read_csv(correlation_path(horizon, analytics_dir), index_col=0)
+    except FileNotFoundError:
+        return None
+    return summary, correlation
+
+
+@metrics.timed("build_analytics")
+def build_analytics(horizons=HORIZONS, analytics_dir=ANALYTICS_DIR):
+    companies = registry.public_companies()
+    benchmarks = registry.indexes()
+    histories = price_cache.get_histories(companies["ticker"].tolist() + list(benchmarks.values()), "max")
+    closes = close_matrix(histories)
+    names = dict(zip(companies["ticker"], companies["name"]))
+
+    for horizon in horizons:
+        window = price_cache.slice_period(closes, horizon)
+        summary, correlation = compute_analytics(window, list(names), benchmarks)
+        summary.insert(0, "Company", summary.index.map(names))
+        with replacing(summary_path(horizon, analytics_dir)) as tmp:
+            summary.round(4).to_csv(tmp)
+        with replacing(correlation_path(horizon, analytics_dir)) as tmp:
+            correlation.round(4).to_csv(tmp)
+
+    print(f"✅ Built sector analytics for {closes.shape[1]} tickers over {len(horizons)} horizons.")
+
+
+if __name__ == "__main__":
+    build_analytics()
+    metrics.dump("build_analytics")
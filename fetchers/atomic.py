@@ -0,0 +1,31 @@
+import contextlib
+import os
+import shutil
+import threading
+
+
+@contextlib.contextmanager
+def replacing(path):
+    """Yield a temporary path next to `path`; it is renamed over `path` only if the block succeeds.
+
+    Temp names are unique per process and thread, so concurrent jobs never clobber each
+    other's half-written files and readers only ever see a complete file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def append_csv(df, path):
+    """Append rows to a CSV (writing a header if the file is new) without exposing a partial file."""
+    with replacing(path) as tmp:
+        if os.path.exists(path):
+            shutil.copyfile(path, tmp)
+            df.to_csv(tmp, mode="a", header=False, index=False)
+        else:
+            df.to_csv(tmp, index=False)
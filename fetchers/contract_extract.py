@@ -0,0 +1,167 @@
+import os
+import re
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fetchers import metrics, registry
+from fetchers.atomic import replacing
+from fetchers.fetch_dod_contracts import CONTRACTS_PATH, load_contracts
+
+AWARDS_PATH = "data/dod_awards.parquet"
+AWARD_COLUMNS = ["date", "agency", "awardee", "awardee_key", "ticker", "amount",
+                 "contract_number", "completion_date", "contracting_activity", "link"]
+
+# Legal-form words that never distinguish one company from another
+LEGAL_SUFFIXES = {"inc", "incorporated", "corp", "corporation", "co", "company", "llc", "ltd", "limited",
+                  "plc", "lp", "llp", "ag", "sa", "spa", "ab", "asa", "nv", "se", "gmbh", "the"}
+# Descriptors that registry names carry but award notices often drop ("Raytheon Technologies" -> "Raytheon Co.")
+GENERIC_WORDS = {"technologies", "industries", "international", "holdings", "group", "defense", "gruppen"}
+
+MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?"
+AMOUNT_RE = re.compile(r"\$(\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?")
+CONTRACT_NUMBER_RE = re.compile(r"\b([A-Z0-9]{6}-?\d{2}-?[A-Z]-?[A-Z0-9]{4})\b")
+COMPLETION_RE = re.compile(
+    rf"complet\w*(?:\s+date)?(?:\s+(?:of|is|by|in))?\s+(?P<date>{MONTH}\s+(?:\d{{1,2}},\s+)?\d{{4}})",
+    re.IGNORECASE,
+)
+SENTENCE_END_RE = re.compile(r"(?<=[a-z0-9)])\.\s+(?=[A-Z(])")
+ACTIVITY_RE = re.compile(r"^(.*?),? (?:is|are) the contracting activit", re.IGNORECASE)
+
+
+def normalize_name(name):
+    name = str(name).lower().replace("&", " and ")
+    name = re.sub(r"[.'’]", "", name)
+    tokens = re.sub(r"[^a-z0-9]+", " ", name).split()
+    return " ".join(t for t in tokens if t not in LEGAL_SUFFIXES)
+
+
+def build_name_lookup(companies):
+    """{normalized name: ticker} from a frame with `name` and `ticker` (and optionally `aliases`) columns.
+
+    Each company is keyed by its full normalized name and its aliases and, when one of those
+    ends in generic descriptors, by the distinctive part alone.
+    """
+    aliases = companies["aliases"] if "aliases" in companies.columns else [""] * len(companies)
+    lookup = {}
+    for name, ticker, others in zip(companies["name"], companies["ticker"], aliases):
+        for alias in [name, *filter(None, (a.strip() for a in others.split(";")))]:
+            key = normalize_name(alias)
+            lookup.setdefault(key, ticker)
+            tokens = key.split()
+            while len(tokens) > 1 and tokens[-1] in GENERIC_WORDS:
+                tokens.pop()
+                lookup.setdefault(" ".join(tokens), ticker)
+    return lookup
+
+
+def match_ticker(awardee_key, lookup):
+    # Longest registry name that prefixes the awardee ("lockheed martin rotary and mission systems")
+    tokens = awardee_key.split()
+    for k in range(len(tokens), 0, -1):
+        ticker = lookup.get(" ".join(tokens[:k]))
+        if ticker:
+            return ticker
+    return None
+
+
+def _parse_completion(text):
+    match = COMPLETION_RE.search(text)
+    if not match:
+        return pd.NaT
+    raw = match.group("date").replace(".", "").replace("Sept ", "Sep ")
+    if "," in raw:
+        return pd.to_datetime(raw, format="mixed", errors="coerce")
+    # Month-only completion ("by June 2029") means the end of that month
+    month = pd.to_datetime(raw, format="mixed", errors="coerce")
+    return month + pd.offsets.MonthEnd(0) if pd.notna(month) else pd.NaT
+
+
+def _is_agency_heading(paragraph):
+    letters = re.sub(r"[^A-Za-z]", "", paragraph)
+    return bool(letters) and letters.isupper() and len(paragraph) < 80 and "$" not in paragraph
+
+
+def extract_awards(contracts, lookup):
+    """One structured record per award paragraph of each announcement in `contracts`."""
+    records = []
+    for date, summary, link in zip(contracts["date"], contracts["summary"].fillna(""), contracts["link"]):
+        agency = None
+        for paragraph in summary.split("\n"):
+            paragraph = paragraph.strip()
+            if _is_agency_heading(paragraph):
+                agency = paragraph.title()
+                continue
+            amount = AMOUNT_RE.search(paragraph)
+            if not amount or "," not in paragraph:
+                continue
+
+            awardee = paragraph.split(",", 1)[0].strip()
+            awardee_key = normalize_name(awardee)
+            contract_number = CONTRACT_NUMBER_RE.search(paragraph)
+            activity = next(filter(None, map(ACTIVITY_RE.search, SENTENCE_END_RE.split(paragraph))), None)
+            records.append({
+                "date": date,
+                "agency": agency,
+                "awardee": awardee,
+                "awardee_key": awardee_key,
+                "ticker": match_ticker(awardee_key, lookup),
+                "amount": float(amount.group(1).replace(",", "")),
+                "contract_number": contract_number.group(1) if contract_number else None,
+                "completion_date": _parse_completion(paragraph),
+                "contracting_activity": activity.group(1).strip() if activity else None,
+                "link": link,
+            })
+
+    awards = pd.DataFrame(records, columns=AWARD_COLUMNS)
+    awards["date"] = pd.to_datetime(awards["date"])
+    awards["completion_date"] = pd.to_datetime(awards["completion_date"])
+    awards["amount"] = awards["amount"].astype("float64")
+    return awards
+
+
+def load_awards(path=AWARDS_PATH, by="ticker"):
+    """Awards indexed by (`by`, date) and sorted, so per-company or per-awardee history is an index slice."""
+    try:
+        awards = pd.read_parquet(path)
+    except (FileNotFoundError, OSError):
+        awards = pd.DataFrame(columns=AWARD_COLUMNS)
+    return awards.set_index([by, "date"]).sort_index()
+
+
+def contracts_per_company(awards, freq="MS"):
+    """Award count and total value per ticker and period, from a ticker-indexed awards frame."""
+    matched = awards[awards.index.get_level_values("ticker").notna()]
+    grouped = matched.groupby([pd.Grouper(level="ticker"), pd.Grouper(level="date", freq=freq)])["amount"]
+    return grouped.agg(["count", "sum"]).rename(columns={"count": "awards", "sum": "value"})
+
+
+@metrics.timed("build_awards")
+def build_awards(contracts_path=CONTRACTS_PATH, path=AWARDS_PATH, companies_path=registry.REGISTRY_PATH):
+    contracts = load_contracts(contracts_path)
+    try:
+        stored = pd.read_parquet(path)
+    except (FileNotFoundError, OSError):
+        stored = pd.DataFrame(columns=AWARD_COLUMNS)
+
+    # Only announcements that have not been extracted yet
+    pending = contracts[~contracts["link"].isin(set(stored["link"]))]
+    lookup = build_name_lookup(registry.public_companies(companies_path))
+    awards = extract_awards(pending, lookup)
+
+    if not awards.empty or stored.empty:
+        frames = [f for f in (stored, awards) if not f.empty]
+        combined = pd.concat(frames, ignore_index=True) if frames else awards
+        combined = combined.sort_values(["ticker", "date"], na_position="last")
+        with replacing(path) as tmp:
+            combined.to_parquet(tmp, index=False)
+
+    matched = awards["ticker"].notna().sum()
+    print(f"✅ Extracted {len(awards)} new contract awards ({matched} matched to tracked companies).")
+
+
+if __name__ == "__main__":
+    build_awards()
+    metrics.dump("build_awards")
@@ -0,0 +1,128 @@
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import feedparser
+
+from fetchers import metrics
+from fetchers.atomic import replacing
+
+STATE_PATH = "data/feed_state.json"
+USER_AGENT = "Mozilla/5.0 (compatible; StingerDefence/1.0; +https://github.com/EthanButton/StingerDefence)"
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state, path=STATE_PATH):
+    with replacing(path) as tmp, open(tmp, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+class _HostLimiter:
+    # One semaphore per host so a single upstream never sees more than `limit` open requests
+    def __init__(self, limit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def __call__(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+
+@metrics.timed("news.feed")
+def fetch_feed(url, state=None, timeout=10, retries=3, backoff=0.5, limiter=None):
+    """Fetch and parse one feed, sending If-None-Match / If-Modified-Since from `state`."""
+    cached = (state or {}).get(url, {})
+    headers = {"User-Agent": USER_AGENT}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+
+    result = {"url": url, "status": None, "entries": None, "etag": cached.get("etag"),
+              "modified": cached.get("modified"), "error": None}
+
+    for attempt in range(retries + 1):
+        try:
+            request = urllib.request.Request(url, headers=headers)
+            semaphore = limiter(url) if limiter else None
+            if semaphore:
+                semaphore.acquire()
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    body = response.read()
+                    result["status"] = response.status
+                    result["etag"] = response.headers.get("ETag") or result["etag"]
+                    result["modified"] = response.headers.get("Last-Modified") or result["modified"]
+            finally:
+                if semaphore:
+                    semaphore.release()
+            result["entries"] = feedparser.parse(body).entries
+            result["error"] = None
+            metrics.count("misses", "news.conditional_get")
+            return result
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                result["status"] = 304
+                result["error"] = None
+                metrics.count("hits", "news.conditional_get")
+                return result
+            result["status"] = e.code
+            result["error"] = str(e)
+            if e.code not in RETRY_STATUSES:
+                metrics.count("errors", "news.feed")
+                return result
+        except (urllib.error.URLError, http.client.HTTPException, TimeoutError, OSError) as e:
+            # HTTPException covers truncated bodies (IncompleteRead) and garbled status lines
+            result["error"] = str(e)
+        except Exception as e:
+            # Anything else (e.g. a parser failure) is recorded, so one bad feed cannot abort a batch
+            result["error"] = f"{type(e).__name__}: {e}"
+            metrics.count("errors", "news.feed")
+            return result
+
+        if attempt < retries:
+            time.sleep(backoff * (2 ** attempt) + random.uniform(0, backoff))
+
+    metrics.count("errors", "news.feed")
+    return result
+
+
+def fetch_feeds(urls, state=None, max_workers=8, per_host=4, timeout=10, retries=3, backoff=0.5):
+    """Fetch many feeds concurrently. Returns {url: result} and updates `state` in place."""
+    urls = list(dict.fromkeys(urls))
+    limiter = _HostLimiter(per_host)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(
+            lambda url: fetch_feed(url, state, timeout=timeout, retries=retries,
+                                   backoff=backoff, limiter=limiter),
+            urls,
+        )
+        results = {r["url"]: r for r in results}
+
+    if state is not None:
+        for url, result in results.items():
+            if result["etag"] or result["modified"]:
+                state[url] = {"etag": result["etag"], "modified": result["modified"]}
+
+    return results
@@ -1,33 +1,59 @@
 import os
-import feedparser
-import pandas as pd
+import sys
+from urllib.parse import quote_plus
 
-COMPANIES = [
-    "Lockheed Martin", "Raytheon", "Northrop Grumman", "General Dynamics",
-    "L3Harris", "BAE Systems", "Airbus", "Boeing", "Thales", "Leonardo", "Huntington Ingalls", "Textron", "Leidos", "Mercury Systems", "Kratos", "Curtiss-Wright", "CACI International", "Oshkosh", "Rheinmetall", "Saab", "Kongsberg Gruppen", "Dassault Aviation", "Hensoldt AG", "Elbit Systems", "Babcock International", "Serco Group", "Rolls-Royce Holdings", "QinetiQ Group", "MTU Aero Engines"
-]
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fetchers import metrics, registry
+from fetchers.feed_engine import fetch_feeds, load_state, save_state
+from fetchers.news_store import upsert_news
+
+def feed_url(query):
+    return f"https://news.google.com/rss/search?q={quote_plus(query)}"
+
+@metrics.timed("fetch_news")
+def fetch_news(queries=None, state=None):
+    """One feed per company, queried as {company: search terms} (the registry's news queries by default).
+
+    `state` is the ETag/Last-Modified map; a long-running caller can keep it in memory across runs.
+    """
+    state = load_state() if state is None else state
+    queries = registry.news_queries() if queries is None else queries
+    urls = {company: feed_url(query) for company, query in queries.items()}
+    results = fetch_feeds(urls.values(), state)
 
-def fetch_news():
     news_items = []
+    unchanged = failed = 0
 
-    for company in COMPANIES:
-        query = company.replace(" ", "+")
-        url = f"https://news.google.com/rss/search?q={query}+defense"
+    # Feeds that answered 304 (or failed) simply contribute nothing new; history stays in the store
+    for company, url in urls.items():
+        result = results[url]
 
-        feed = feedparser.parse(url)
+        if result["entries"] is None:
+            if result["status"] == 304:
+                unchanged += 1
+            else:
+                failed += 1
+                print(f"⚠️ {company}: {result['error']}")
+            continue
 
-        for entry in feed.entries[:5]:
+        # Feeds omit fields now and then (undated items especially); the store handles blanks
+        for entry in result["entries"][:5]:
             news_items.append({
                 "company": company,
-                "title": entry.title,
-                "link": entry.link,
-                "published": entry.published
+                "title": entry.get("title", ""),
+                "link": entry.get("link", ""),
+                "published": entry.get("published", "")
             })
 
-    os.makedirs("data", exist_ok=True)
-    df = pd.DataFrame(news_items)
-    df.to_csv("data/defense_news.csv", index=False)
-    print(f"✅ Saved {len(df)} news stories.")
+    # A few failed feeds are routine; all of them failing (network down, blocked) fails the job
+    if urls and failed == len(urls):
+        raise RuntimeError(f"All {failed} news feeds failed")
+
+    added = upsert_news(news_items)
+    save_state(state)
+    print(f"✅ Added {added} new news stories ({unchanged} feeds unchanged, {failed} failed).")
 
 if __name__ == "__main__":
     fetch_news()
+    metrics.dump("fetch_news")
@@ -1,39 +1,186 @@
 import os
-import requests
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin
+
 import pandas as pd
+import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fetchers import metrics
+from fetchers.atomic import append_csv, replacing
+
+BASE_URL = "https://www.defense.gov"
+LISTING_URL = f"{BASE_URL}/News/Contracts/"
+CONTRACTS_PATH = "data/dod_contracts.csv"
+COLUMNS = ["date", "title", "summary", "link"]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36"
+}
+
+ARTICLE_HREF = re.compile(r"/News/Contracts/Contract/Article/\d+")
+TITLE_DATE = re.compile(r"Contracts?\s+for\s+(?P<date>[A-Za-z]+\.?\s+\d{1,2},\s+\d{4})", re.IGNORECASE)
 
-def fetch_dod_contracts():
-    url = "https://www.defense.gov/News/Contracts/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36"
-    }
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    articles = soup.find_all("article", class_="contract")
+class Politeness:
+    # Minimum spacing between requests across all worker threads
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
 
-    data = []
-    for article in articles:
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if delay:
+            time.sleep(delay)
+
+
+def make_session(pool_size=4, retries=3):
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_title_date(title):
+    match = TITLE_DATE.search(title)
+    if not match:
+        return None
+    # defense.gov abbreviates months as "Sept.", "Jan.", ... or spells them out ("March")
+    raw = match.group("date").replace(".", "").replace("Sept ", "Sep ")
+    for fmt in ("%b %d, %Y", "%B %d, %Y"):
         try:
-            title = article.find("h3").text.strip()
-            date = article.find("time")["datetime"].split("T")[0]
-            summary = article.find("div", class_="contract-content").text.strip()
-            link = article.find("a")["href"]
-            data.append({
-                "date": date,
-                "title": title,
-                "summary": summary,
-                "link": f"https://www.defense.gov{link}"
-            })
-        except Exception as e:
-            print(f"⚠️ Skipped a contract due to parsing error: {e}")
-
-    os.makedirs("data", exist_ok=True)
-    df = pd.DataFrame(data)
-    df.to_csv("data/dod_contracts.csv", index=False)
-    print(f"✅ Saved {len(data)} DoD contract entries.")
+            return datetime.strptime(raw, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_listing(html, base_url=BASE_URL):
+    """Contract announcements on one listing page as [{date, title, link}], newest first."""
+    soup = BeautifulSoup(html, "lxml")
+    items, seen = [], set()
+    for anchor in soup.find_all("a", href=ARTICLE_HREF):
+        title = anchor.get_text(" ", strip=True)
+        link = anchor["href"]
+        if not title or link in seen:
+            continue
+        seen.add(link)
+
+        date = parse_title_date(title)
+        if date is None:
+            time_tag = anchor.find_parent().find("time") if anchor.find_parent() else None
+            if time_tag and time_tag.get("datetime"):
+                date = time_tag["datetime"].split("T")[0]
+        if date is None:
+            continue
+
+        items.append({"date": date, "title": title, "link": urljoin(base_url, link)})
+    return items
+
+
+def parse_article(html):
+    """Announcement text, one paragraph per line (agency headings keep their own line)."""
+    soup = BeautifulSoup(html, "lxml")
+    body = soup.find("div", class_="body") or soup.find("article") or soup.body
+    if body is None:
+        return ""
+    paragraphs = [p.get_text(" ", strip=True) for p in body.find_all("p")]
+    return "\n".join(p for p in paragraphs if p)
+
+
+def load_contracts(path=CONTRACTS_PATH):
+    try:
+        return pd.read_csv(path)
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return pd.DataFrame(columns=COLUMNS)
+
+
+def _try_get(get, url):
+    try:
+        return get(url)
+    except requests.RequestException:
+        metrics.count("errors", "dod.request")
+        return None
+
+
+@metrics.timed("fetch_dod_contracts")
+def fetch_dod_contracts(max_pages=5, workers=4, interval=0.5, listing_url=LISTING_URL, path=CONTRACTS_PATH,
+                        session=None):
+    stored = load_contracts(path)
+    high_water = stored["date"].max() if not stored.empty else None
+    known_links = set(stored["link"])
+
+    # A long-running caller can pass its own session to keep connections warm between runs
+    session = session or make_session(pool_size=workers)
+    polite = Politeness(interval)
+
+    def get(url):
+        polite.wait()
+        with metrics.timed("dod.request"):
+            response = session.get(url, timeout=20)
+            response.raise_for_status()
+        return response.text
+
+    # Listing pages are fetched `workers` at a time until one reaches the high-water mark
+    candidates = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        page = 1
+        while page <= max_pages:
+            batch = list(range(page, min(page + workers, max_pages + 1)))
+            urls = [listing_url if p == 1 else f"{listing_url}?Page={p}" for p in batch]
+            # A page that cannot be fetched counts as empty, which also ends the crawl after this batch
+            listings = []
+            for url, html in zip(urls, pool.map(lambda u: _try_get(get, u), urls)):
+                if html is None:
+                    print(f"⚠️ Skipped a contract listing page that could not be fetched: {url}")
+                listings.append(parse_listing(html, listing_url) if html is not None else [])
+            for items in listings:
+                candidates.extend(items)
+            page += len(batch)
+            if high_water and any(item["date"] < high_water for items in listings for item in items):
+                break
+            if not all(listings):
+                break
+
+        new_items = [item for item in dict((c["link"], c) for c in candidates).values()
+                     if item["link"] not in known_links and (high_water is None or item["date"] >= high_water)]
+
+        data = []
+        for item, html in zip(new_items, pool.map(lambda i: _try_get(get, i["link"]), new_items)):
+            if html is None:
+                print(f"⚠️ Skipped a contract announcement that could not be fetched: {item['link']}")
+                continue
+            data.append({**item, "summary": parse_article(html)})
+
+    if data:
+        df = pd.DataFrame(data, columns=COLUMNS).sort_values("date")
+        if stored.empty:
+            with replacing(path) as tmp:
+                df.to_csv(tmp, index=False)
+        else:
+            append_csv(df, path)
+    elif stored.empty:
+        with replacing(path) as tmp:
+            pd.DataFrame(columns=COLUMNS).to_csv(tmp, index=False)
+    print(f"✅ Saved {len(data)} new DoD contract entries.")
+
 
 if __name__ == "__main__":
     fetch_dod_contracts()
+    metrics.dump("fetch_dod_contracts")
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics
+
+QUOTE_COLUMNS = ["Ticker", "Price", "Change %", "Volume", "Market Cap", "P/E Ratio", "52W Change", "Beta"]
+
+# Fields that only the per-symbol quote summary carries; everything else comes from one batched download
+INFO_FIELDS = {"Market Cap": "marketCap", "P/E Ratio": "trailingPE", "Beta": "beta"}
+INFO_FALLBACK = {"Price": "regularMarketPrice", "Change %": "regularMarketChangePercent",
+                 "Volume": "volume", "52W Change": "52WeekChange"}
+
+
+def _last_valid(frame, offset=1):
+    # Value at each column's `offset`-th last non-null row (trading calendars differ across exchanges)
+    return frame.apply(lambda s: s.dropna().iloc[-offset] if s.count() >= offset else np.nan)
+
+
+@metrics.timed("yfinance.download_quotes")
+def _download_quotes(tickers):
+    import yfinance as yf  # deferred: importing yfinance costs ~1s and only the refresher needs it
+
+    hist = yf.download(tickers, period="1y", interval="1d", group_by="column",
+                       auto_adjust=False, progress=False, threads=True)
+    if hist is None or hist.empty:
+        return pd.DataFrame(index=tickers, columns=["Price", "Change %", "Volume", "52W Change"], dtype="float64")
+
+    closes = hist["Close"].reindex(columns=tickers)
+    volumes = hist["Volume"].reindex(columns=tickers)
+
+    price = _last_valid(closes)
+    previous = _last_valid(closes, offset=2)
+    first = closes.bfill().iloc[0]
+
+    return pd.DataFrame({
+        "Price": price,
+        "Change %": (price / previous - 1) * 100,
+        "Volume": _last_valid(volumes),
+        "52W Change": price / first - 1,
+    })
+
+
+def _fetch_info(ticker):
+    import yfinance as yf
+
+    try:
+        with metrics.timed("yfinance.info"):
+            return yf.Ticker(ticker).info or {}
+    except Exception:
+        return {}
+
+
+@metrics.timed("fetch_quotes")
+def fetch_quotes(tickers, max_workers=8):
+    """Latest quote fields for `tickers` as a float64 DataFrame, one row per ticker."""
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return pd.DataFrame(columns=QUOTE_COLUMNS)
+
+    try:
+        quotes = _download_quotes(tickers)
+    except Exception as e:
+        print(f"⚠️ Batched quote download failed: {e}")
+        quotes = pd.DataFrame(index=tickers, columns=["Price", "Change %", "Volume", "52W Change"], dtype="float64")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        infos = dict(zip(tickers, pool.map(_fetch_info, tickers)))
+
+    for column, key in INFO_FIELDS.items():
+        quotes[column] = [infos[t].get(key) for t in tickers]
+
+    # Symbols the batched download could not resolve fall back to the quote summary
+    for column, key in INFO_FALLBACK.items():
+        fallback = pd.Series([infos[t].get(key) for t in tickers], index=tickers)
+        quotes[column] = quotes[column].fillna(pd.to_numeric(fallback, errors="coerce"))
+
+    quotes = quotes.apply(pd.to_numeric, errors="coerce").astype("float64")
+    quotes = quotes.dropna(how="all")
+    quotes.insert(0, "Ticker", quotes.index)
+    return quotes.reset_index(drop=True)[QUOTE_COLUMNS]
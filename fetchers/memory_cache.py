@@ -0,0 +1,120 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics
+
+BUDGET_MB = float(os.environ.get("STINGER_CACHE_MB", 256))
+
+_MISSING = object()
+
+
+def sizeof(value):
+    """Approximate resident bytes of a cached value (deep for frames, arrays and containers)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def compact(frame, floats=(), categories=()):
+    """Copy of `frame` with the named columns narrowed to float32 and categorical."""
+    dtypes = {col: "float32" for col in floats if col in frame.columns}
+    dtypes.update({col: "category" for col in categories if col in frame.columns})
+    return frame.astype(dtypes) if dtypes else frame
+
+
+class MemoryCache:
+    """Thread-safe LRU cache bounded by the total size of its values rather than by entry count.
+
+    Keys are tuples whose first item names the kind of data ("history", "stinger_index", ...);
+    hits and misses are also counted per kind in the metrics registry. A value larger than
+    the whole budget is returned to the caller but never stored.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, bytes, expires at)
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        metrics.count("misses" if entry is None else "hits", f"memory_cache.{key[0]}")
+        return default if entry is None else entry[0]
+
+    def put(self, key, value, ttl=None):
+        nbytes = sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return value
+            self._entries[key] = (value, nbytes, time.monotonic() + ttl if ttl else None)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def get_or_load(self, key, load, ttl=None):
+        value = self.get(key, _MISSING)
+        return self.put(key, load(), ttl) if value is _MISSING else value
+
+    def discard(self, prefix):
+        """Drop every entry whose key starts with the tuple `prefix`."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries), "resident MB": self._bytes / 2**20,
+                "budget MB": self.max_bytes / 2**20, "hits": self.hits, "misses": self.misses,
+                "hit rate": self.hits / lookups if lookups else 0.0, "evictions": self.evictions,
+            }
+
+    def usage(self):
+        """Entries and resident MB per kind of data, largest first."""
+        with self._lock:
+            rows = [(key[0], nbytes) for key, (_, nbytes, _) in self._entries.items()]
+        df = pd.DataFrame(rows, columns=["kind", "bytes"])
+        usage = df.groupby("kind")["bytes"].agg(entries="count", MB=lambda b: b.sum() / 2**20)
+        return usage.sort_values("MB", ascending=False).reset_index()
+
+
+# One budget for the whole process, shared by every Streamlit session (STINGER_CACHE_MB, default 256)
+CACHE = MemoryCache(int(BUDGET_MB * 2**20))
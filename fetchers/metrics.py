@@ -0,0 +1,149 @@
+import bisect
+import contextlib
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+import pandas as pd
+
+METRICS_DIR = "data/cache/metrics"
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+SAMPLES = 2048  # recent observations kept per stage for p50/p95
+COUNTER_KINDS = ("hits", "misses", "errors")
+
+
+class _Stage:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.samples = deque(maxlen=SAMPLES)
+
+
+class Registry:
+    """Process-wide latency histograms plus cache hit/miss and upstream error counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = defaultdict(_Stage)
+        self._counters = defaultdict(int)
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            s = self._stages[stage]
+            s.count += 1
+            s.total += seconds
+            s.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+            s.samples.append(seconds)
+
+    def count(self, kind, name, n=1):
+        with self._lock:
+            self._counters[(kind, name)] += n
+
+    def timed(self, stage):
+        """Context manager, or decorator, recording the wall time of `stage`."""
+        return _Timed(self, stage)
+
+    def summary(self):
+        """One row per stage or counter name: calls, mean/p50/p95 in ms, hits, misses, errors."""
+        with self._lock:
+            stages = {name: (s.count, s.total, list(s.samples)) for name, s in self._stages.items()}
+            counters = dict(self._counters)
+
+        names = sorted(set(stages) | {name for _, name in counters})
+        rows = []
+        for name in names:
+            calls, total, samples = stages.get(name, (0, 0.0, []))
+            p50, p95 = np.percentile(samples, [50, 95]) * 1000 if samples else (np.nan, np.nan)
+            rows.append({
+                "stage": name, "calls": calls,
+                "mean ms": total / calls * 1000 if calls else np.nan, "p50 ms": p50, "p95 ms": p95,
+                **{kind: counters.get((kind, name), 0) for kind in COUNTER_KINDS},
+            })
+        return pd.DataFrame(rows, columns=["stage", "calls", "mean ms", "p50 ms", "p95 ms", *COUNTER_KINDS])
+
+    def to_prometheus(self):
+        with self._lock:
+            stages = {name: (s.count, s.total, list(s.buckets), list(s.samples)) for name, s in self._stages.items()}
+            counters = dict(self._counters)
+
+        lines = ["# TYPE stinger_stage_seconds histogram"]
+        for name, (calls, total, buckets, samples) in sorted(stages.items()):
+            cumulative = 0
+            for bound, n in zip(BUCKETS, buckets):
+                cumulative += n
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f'stinger_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'stinger_stage_seconds_sum{{stage="{name}"}} {total:.6f}')
+            lines.append(f'stinger_stage_seconds_count{{stage="{name}"}} {calls}')
+            if samples:
+                p50, p95 = np.percentile(samples, [50, 95])
+                lines.append(f'stinger_stage_seconds_recent{{stage="{name}",quantile="0.5"}} {p50:.6f}')
+                lines.append(f'stinger_stage_seconds_recent{{stage="{name}",quantile="0.95"}} {p95:.6f}')
+
+        for kind in COUNTER_KINDS:
+            lines.append(f"# TYPE stinger_{kind}_total counter")
+            for (k, name), n in sorted(counters.items()):
+                if k == kind:
+                    lines.append(f'stinger_{kind}_total{{name="{name}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, job, metrics_dir=METRICS_DIR):
+        """Write the Prometheus text exposition to `metrics_dir/<job>.prom`."""
+        os.makedirs(metrics_dir, exist_ok=True)
+        path = os.path.join(metrics_dir, f"{job}.prom")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+
+class _Timed(contextlib.ContextDecorator):
+    # Exceptions escaping a timed block count as errors for that stage
+    def __init__(self, registry, stage):
+        self.registry = registry
+        self.stage = stage
+
+    def _recreate_cm(self):
+        # Fresh timer per decorated call, so concurrent calls do not share a start time
+        return _Timed(self.registry, self.stage)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self.registry.count("errors", self.stage)
+        self.registry.observe(self.stage, time.perf_counter() - self._start)
+        return False
+
+
+REGISTRY = Registry()
+timed = REGISTRY.timed
+count = REGISTRY.count
+summary = REGISTRY.summary
+dump = REGISTRY.dump
+
+
+def read_dumps(metrics_dir=METRICS_DIR):
+    """{job: Prometheus text} for every metrics file written by the fetchers."""
+    dumps = {}
+    try:
+        names = sorted(os.listdir(metrics_dir))
+    except FileNotFoundError:
+        return dumps
+    for name in names:
+        if name.endswith(".prom"):
+            with open(os.path.join(metrics_dir, name)) as f:
+                dumps[name[:-len(".prom")]] = f.read()
+    return dumps
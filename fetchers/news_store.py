@@ -0,0 +1,131 @@
+import glob
+import hashlib
+import os
+import re
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics, registry
+from fetchers.atomic import append_csv, replacing
+from fetchers.news_tagging import tag_news
+
+NEWS_DIR = "data/news"
+COLUMNS = ["id", "company", "title", "link", "published", "tags", "contract_value"]
+FEED_COLUMNS = ["company", "title", "link", "published"]
+PUBLISHED_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"  # RFC-822 as Google News sends it: "Wed, 03 Sep 2025 19:29:05 GMT"
+
+# The news store is a set of append-only CSV partitions, one per month of publication
+# (data/news/2025-09.csv, ...). A run only appends rows that are not already stored, so
+# disk writes and git diffs scale with the number of new stories rather than with history.
+
+
+def article_id(link, title):
+    # Google News links differ only by tracking query strings (?oc=5), so key on host + path
+    # and fall back to the normalized title when an entry has no link
+    if isinstance(link, str) and link.strip():
+        parts = urlsplit(link.strip())
+        key = f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    else:
+        key = re.sub(r"\s+", " ", str(title)).strip().lower()
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _partition_path(partition, news_dir):
+    return os.path.join(news_dir, f"{partition}.csv")
+
+
+def _parse_one(published):
+    try:
+        return parsedate_to_datetime(published)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def parse_published(published):
+    """UTC datetime64 series from feed date strings (NaT when unparseable).
+
+    The usual GMT form is parsed in one vectorized pass; other RFC-822 variants
+    ("+0000", "EST", ...) fall back to email.utils one by one.
+    """
+    parsed = pd.to_datetime(published, format=PUBLISHED_FORMAT, utc=True, errors="coerce")
+    rest = parsed.isna() & published.astype(str).str.strip().ne("")
+    if rest.any():
+        parsed[rest] = pd.to_datetime(published[rest].map(_parse_one, na_action="ignore"), utc=True, errors="coerce")
+    return parsed
+
+
+def _read_partition(path):
+    df = pd.read_csv(path, dtype={"tags": str}, keep_default_na=False, na_values={"contract_value": [""]})
+    # Partitions written before ingestion-time tagging get their tags computed on load
+    if "tags" not in df.columns or "contract_value" not in df.columns:
+        df = tag_news(df)
+    return df
+
+
+def partitions_for(published):
+    return parse_published(published).dt.tz_convert(None).dt.to_period("M").astype("string").fillna("undated")
+
+
+@metrics.timed("news.load")
+def load_news(news_dir=NEWS_DIR):
+    """All stored stories as a typed frame, newest first.
+
+    `published` is a UTC datetime64 column (undated stories last) and `company` is a categorical
+    of registry names.
+    """
+    paths = sorted(glob.glob(os.path.join(news_dir, "*.csv")))
+    frames = [_read_partition(path) for path in paths]
+    if not frames:
+        return pd.DataFrame(columns=COLUMNS)
+    df = pd.concat(frames, ignore_index=True)
+    df["published"] = parse_published(df["published"])
+    # Older partitions use short feed names ("Raytheon"); the registry maps them to one name
+    company = df["company"].astype(str).str.strip().astype("category")
+    df["company"] = registry.canonical_names(company).astype("category")
+    df = df.sort_values("published", ascending=False, na_position="last", kind="stable", ignore_index=True)
+    return df[COLUMNS]
+
+
+def company_index(df):
+    """{company: row positions} for a frame from load_news, each in the frame's newest-first order."""
+    return {company: np.asarray(rows) for company, rows in df.groupby("company", observed=True).indices.items()}
+
+
+@metrics.timed("news.upsert")
+def upsert_news(items, news_dir=NEWS_DIR):
+    """Append stories that are not stored yet. Returns the number of rows written."""
+    df = pd.DataFrame(items, columns=FEED_COLUMNS)
+    if df.empty:
+        return 0
+
+    df.insert(0, "id", [article_id(link, title) for link, title in zip(df["link"], df["title"])])
+    # One article often matches several company queries; the first match wins
+    df = df.drop_duplicates("id", keep="first")
+    df = tag_news(df)
+    df["_partition"] = partitions_for(df["published"])
+
+    os.makedirs(news_dir, exist_ok=True)
+    written = 0
+    for partition, rows in df.groupby("_partition", sort=True):
+        path = _partition_path(partition, news_dir)
+        if os.path.exists(path) and pd.read_csv(path, nrows=0).columns.tolist() != COLUMNS:
+            # A partition from before ingestion-time tagging has fewer columns, so it is
+            # rewritten tagged rather than appended to with rows of a different width
+            stored = _read_partition(path)
+            rows = rows[~rows["id"].isin(stored["id"])]
+            with replacing(path) as tmp:
+                pd.concat([stored[COLUMNS], rows[COLUMNS]]).to_csv(tmp, index=False)
+            written += len(rows)
+            continue
+        if os.path.exists(path):
+            stored = set(pd.read_csv(path, usecols=["id"])["id"])
+            rows = rows[~rows["id"].isin(stored)]
+        if rows.empty:
+            continue
+        append_csv(rows[COLUMNS], path)
+        written += len(rows)
+
+    return written
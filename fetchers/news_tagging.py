@@ -0,0 +1,57 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics
+
+KEYWORDS = ["missile", "radar", "ship", "drone", "contract", "aircraft", "satellite", "cyber", "million", "billion"]
+
+# One compiled alternation for every keyword. Matches at word starts, so "missiles" and
+# "shipbuilding" count but "partnership" does not.
+KEYWORD_RE = re.compile(r"\b(" + "|".join(map(re.escape, KEYWORDS)) + r")", re.IGNORECASE)
+
+# "$9.8 billion", "$450M", "$1,234,567", "$2bn"
+AMOUNT_RE = re.compile(
+    r"\$\s?(?P<number>\d+(?:,\d{3})*(?:\.\d+)?)\s*(?P<unit>trillion|billion|million|bn|tn|[mbk])?\b",
+    re.IGNORECASE,
+)
+UNIT_SCALE = {"k": 1e3, "m": 1e6, "million": 1e6, "b": 1e9, "bn": 1e9, "billion": 1e9, "tn": 1e12, "trillion": 1e12}
+
+
+def tag_titles(titles):
+    """Semicolon-separated keyword tags per title, in KEYWORDS order ("" when none match)."""
+    found = titles.fillna("").str.lower().str.findall(KEYWORD_RE)
+    order = {kw: i for i, kw in enumerate(KEYWORDS)}
+    return found.map(lambda kws: ";".join(sorted(set(kws), key=order.get)))
+
+
+def extract_amounts(titles):
+    """First dollar amount mentioned in each title, in US dollars (NaN when there is none)."""
+    parts = titles.fillna("").str.extract(AMOUNT_RE)
+    number = pd.to_numeric(parts["number"].str.replace(",", "", regex=False), errors="coerce")
+    scale = parts["unit"].str.lower().map(UNIT_SCALE).fillna(1.0)
+    return (number * scale).astype("float64")
+
+
+@metrics.timed("news.tagging")
+def tag_news(df):
+    """Adds `tags` and `contract_value` columns computed over the whole title column at once."""
+    df = df.copy()
+    df["tags"] = tag_titles(df["title"])
+    df["contract_value"] = extract_amounts(df["title"])
+    return df
+
+
+def tag_matrix(tags):
+    """Boolean row x tag matrix for filtering, built once per news snapshot."""
+    return tags.fillna("").str.get_dummies(sep=";").astype(bool).reindex(columns=KEYWORDS, fill_value=False)
+
+
+def format_amount(value):
+    if value is None or np.isnan(value):
+        return ""
+    for scale, unit in [(1e12, "trillion"), (1e9, "billion"), (1e6, "million")]:
+        if value >= scale:
+            return f"${value / scale:,.1f} {unit}"
+    return f"${value:,.0f}"
@@ -0,0 +1,97 @@
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fetchers import metrics
+from fetchers.analytics import build_analytics
+from fetchers.contract_extract import build_awards
+from fetchers.feed_engine import load_state
+from fetchers.fetch_defense_news import fetch_news
+from fetchers.fetch_dod_contracts import fetch_dod_contracts, make_session
+from fetchers.refresher import Refresher
+from fetchers.stinger_index import build_indexes
+
+# Every scheduled data job, runnable once (`python -m fetchers run`) or on a schedule in one
+# long-lived process (`python -m fetchers daemon`). Jobs write disjoint outputs, each of them
+# atomically, so they can run side by side.
+
+
+def run_news(feed_state=None):
+    fetch_news(state=feed_state)
+
+
+def run_contracts(session=None):
+    fetch_dod_contracts(session=session)
+    build_awards()
+
+
+def run_market():
+    build_indexes()
+    build_analytics()
+
+
+# name: (job, interval in seconds for daemon mode)
+JOBS = {
+    "news": (run_news, 30 * 60),
+    "contracts": (run_contracts, 30 * 60),
+    "market": (run_market, 60 * 60),
+}
+
+
+def _run_one(name, dump=False):
+    # Top-level so it can be shipped to a worker process; returns (name, seconds, error)
+    start = time.perf_counter()
+    error = None
+    try:
+        JOBS[name][0]()
+    except Exception:
+        error = traceback.format_exc(limit=3)
+    if dump:
+        metrics.dump(name)
+    return name, time.perf_counter() - start, error
+
+
+def run_once(names=None, workers=None, processes=False):
+    """Run the named jobs (all by default) in parallel once. Returns the number that failed.
+
+    With `processes`, each job gets its own interpreter and writes its own metrics file;
+    otherwise jobs share this process and one `fetchers` metrics file.
+    """
+    names = list(names or JOBS)
+    pool_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_type(max_workers=workers or len(names)) as pool:
+        results = list(pool.map(_run_one, names, [processes] * len(names)))
+    if not processes:
+        metrics.dump("fetchers")
+
+    failed = 0
+    for name, seconds, error in results:
+        if error:
+            failed += 1
+            print(f"⚠️ {name} failed after {seconds:.1f}s:\n{error}")
+        else:
+            print(f"✅ {name} finished in {seconds:.1f}s")
+    return failed
+
+
+def run_daemon(workers=None, poll=30):
+    """Run every job on its interval forever, keeping feed state and HTTP connections warm."""
+    feed_state = load_state()
+    session = make_session()
+    jobs = {
+        "news": (lambda: run_news(feed_state), JOBS["news"][1]),
+        "contracts": (lambda: run_contracts(session), JOBS["contracts"][1]),
+        "market": JOBS["market"],
+    }
+    refresher = Refresher(jobs, max_workers=workers or len(jobs)).start()
+    print(f"✅ Scheduling {', '.join(jobs)} (Ctrl+C to stop)")
+
+    reported = {}
+    while True:
+        time.sleep(poll)
+        for name in jobs:
+            error = refresher.error(name)
+            if error and error != reported.get(name):
+                print(f"⚠️ {name} failed:\n{error}")
+            reported[name] = error
+        metrics.dump("fetchers")
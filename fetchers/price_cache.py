@@ -0,0 +1,218 @@
+import contextlib
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics
+from fetchers.memory_cache import compact
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked refreshes
+    fcntl = None
+
+CACHE_DIR = "data/cache/prices"
+MAX_AGE = 15 * 60  # seconds before a ticker's latest bars are refreshed
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+PRICE_FIELDS = ["Open", "High", "Low", "Close"]
+
+# Daily OHLCV bars are kept per ticker as Parquet files shared by every Streamlit session and
+# process on the host. The first request for a ticker downloads its full history once; after
+# that only bars newer than the last stored date are fetched, and every `period` is answered
+# by slicing locally. A ticker yfinance has no data for is kept as an empty file, so it is only
+# retried once that file goes stale.
+
+
+def _path(ticker, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9._-]", "_", ticker) + ".parquet")
+
+
+@contextlib.contextmanager
+def _locked(cache_dir=CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, ".lock"), "w") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _is_fresh(ticker, max_age, cache_dir=CACHE_DIR):
+    try:
+        return time.time() - os.path.getmtime(_path(ticker, cache_dir)) < max_age
+    except FileNotFoundError:
+        return False
+
+
+def read_history(ticker, cache_dir=CACHE_DIR):
+    """Stored bars for `ticker` (empty if yfinance had none), or None if it has never been fetched.
+    Never touches the network."""
+    try:
+        return pd.read_parquet(_path(ticker, cache_dir), memory_map=True)
+    except (FileNotFoundError, OSError):
+        return None
+
+
+def _write_history(ticker, frame, cache_dir=CACHE_DIR):
+    path = _path(ticker, cache_dir)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    frame.to_parquet(tmp)
+    os.replace(tmp, path)
+
+
+@metrics.timed("yfinance.download_history")
+def _download(tickers, **kwargs):
+    import yfinance as yf  # deferred: only refreshes need it, plain cache reads do not
+
+    data = yf.download(tickers, interval="1d", group_by="column", auto_adjust=True,
+                       progress=False, threads=True, **kwargs)
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for ticker in tickers:
+        try:
+            frame = data.xs(ticker, axis=1, level=1)[FIELDS].dropna(subset=["Close"])
+        except KeyError:
+            continue
+        if not frame.empty:
+            frame.index = pd.DatetimeIndex(frame.index).tz_localize(None).rename("Date")
+            frames[ticker] = frame
+    return frames
+
+
+def _same_basis(frame, bars):
+    # Completed bars both copies have (the last stored bar may have been a partial intraday one);
+    # with auto_adjust, a split or dividend since the last refresh rescales every earlier close
+    overlap = frame.index[:-1].intersection(bars.index)
+    return np.allclose(frame.loc[overlap, "Close"], bars.loc[overlap, "Close"], rtol=1e-4)
+
+
+def refresh(tickers, cache_dir=CACHE_DIR):
+    """Download missing history for `tickers`: everything for new tickers, only newer bars otherwise.
+
+    A ticker whose overlapping bars no longer match the stored ones (a split or dividend has
+    re-adjusted its history) is downloaded in full again. A ticker with no data at all is
+    stored as an empty history, so it is not retried until it goes stale.
+    """
+    stored = {t: read_history(t, cache_dir) for t in tickers}
+    cold = [t for t, frame in stored.items() if frame is None or frame.empty]
+    warm = [t for t in tickers if t not in cold]
+
+    updated = _download(cold, period="max") if cold else {}
+
+    if warm:
+        # Re-fetch from the last complete stored bar: it is compared to detect re-adjustments,
+        # and the bar after it may have been a partial intraday one that needs replacing
+        start = min(stored[t].index[-2:].min() for t in warm)
+        readjusted = []
+        for ticker, bars in _download(warm, start=start.strftime("%Y-%m-%d")).items():
+            frame = stored[ticker]
+            if _same_basis(frame, bars):
+                updated[ticker] = pd.concat([frame[frame.index < bars.index.min()], bars])
+            else:
+                readjusted.append(ticker)
+        if readjusted:
+            metrics.count("readjusted", "price_cache", len(readjusted))
+            updated.update(_download(readjusted, period="max"))
+
+    for ticker, frame in updated.items():
+        _write_history(ticker, frame, cache_dir)
+
+    for ticker in cold:
+        if ticker not in updated:
+            _write_history(ticker, pd.DataFrame(columns=FIELDS, index=pd.DatetimeIndex([], name="Date"),
+                                                dtype="float64"), cache_dir)
+
+    # Touch tickers with no new bars so they count as fresh until MAX_AGE passes again
+    for ticker in warm:
+        if ticker not in updated:
+            os.utime(_path(ticker, cache_dir))
+
+    return updated
+
+
+def slice_period(frame, period):
+    """Rows of `frame` covering a yfinance-style period ("5d", "3mo", "ytd", "2y", "max")."""
+    if frame is None or frame.empty or period == "max":
+        return frame
+
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if period == "ytd":
+        start = pd.Timestamp(year=frame.index.max().year, month=1, day=1)
+    elif match and match.group(2) == "d":
+        return frame.iloc[-int(match.group(1)):]
+    elif match:
+        n, unit = int(match.group(1)), match.group(2)
+        offset = {"wk": pd.DateOffset(weeks=n), "mo": pd.DateOffset(months=n), "y": pd.DateOffset(years=n)}[unit]
+        start = pd.Timestamp.today().normalize() - offset
+    else:
+        raise ValueError(f"Unsupported period: {period}")
+
+    return frame[frame.index >= start]
+
+
+def refresh_stale(tickers, max_age=MAX_AGE, cache_dir=CACHE_DIR):
+    stale = [t for t in tickers if not _is_fresh(t, max_age, cache_dir)]
+    metrics.count("hits", "price_cache", len(tickers) - len(stale))
+    metrics.count("misses", "price_cache", len(stale))
+    if not stale:
+        return
+
+    with _locked(cache_dir):
+        # Another process may have refreshed these while we waited for the lock
+        stale = [t for t in stale if not _is_fresh(t, max_age, cache_dir)]
+        if stale:
+            try:
+                refresh(stale, cache_dir)
+            except Exception as e:
+                print(f"⚠️ Price history refresh failed: {e}")
+
+
+def _read_in_memory(ticker, memory, cache_dir=CACHE_DIR):
+    # Full history with float32 prices, keyed by the file's mtime so a refresh invalidates it
+    try:
+        mtime = os.path.getmtime(_path(ticker, cache_dir))
+    except FileNotFoundError:
+        return None
+    key = ("history", cache_dir, ticker, mtime)
+    frame = memory.get(key)
+    if frame is None:
+        frame = read_history(ticker, cache_dir)
+        if frame is not None:
+            memory.discard(key[:3])
+            frame = memory.put(key, compact(frame, floats=PRICE_FIELDS))
+    return frame
+
+
+@metrics.timed("price_cache.read")
+def read_histories(tickers, period="1mo", cache_dir=CACHE_DIR, memory=None):
+    """{ticker: stored bars for `period`} without any network access; unknown tickers are left out.
+
+    With `memory` (a MemoryCache), full histories stay resident with float32 prices and each
+    period is a slice of the cached frame.
+    """
+    histories = {}
+    for ticker in tickers:
+        stored = _read_in_memory(ticker, memory, cache_dir) if memory is not None else read_history(ticker, cache_dir)
+        frame = slice_period(stored, period)
+        if frame is not None and not frame.empty:
+            histories[ticker] = frame
+    return histories
+
+
+def get_histories(tickers, period="1mo", max_age=MAX_AGE, cache_dir=CACHE_DIR):
+    """{ticker: bars for `period`}, refreshing stale tickers in one batched download."""
+    tickers = list(dict.fromkeys(tickers))
+    refresh_stale(tickers, max_age, cache_dir)
+    return read_histories(tickers, period, cache_dir)
+
+
+def get_history(ticker, period="1mo", max_age=MAX_AGE, cache_dir=CACHE_DIR):
+    return get_histories([ticker], period, max_age, cache_dir).get(ticker, pd.DataFrame(columns=FIELDS))
@@ -0,0 +1,97 @@
+import math
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Refresher:
+    """Runs refresh jobs on a schedule in one daemon thread and keeps their latest results.
+
+    `jobs` maps a name to (callable, interval in seconds). Readers call `get(name)` and receive
+    the most recent successful result with its age; they never wait on the upstream call.
+    A failed run keeps the previous result and records the error.
+
+    With `max_workers` > 1, due jobs run concurrently on a thread pool; a job is never
+    started again while its previous run is still in flight.
+    """
+
+    def __init__(self, jobs, max_workers=1):
+        self.jobs = jobs
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="stinger-job") if max_workers > 1 else None
+        self._lock = threading.Lock()
+        self._snapshot = {}
+        self._versions = {name: 0 for name in jobs}
+        self._errors = {}
+        self._due = {name: 0.0 for name in jobs}
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stinger-refresher", daemon=True)
+
+    def start(self):
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    def get(self, name):
+        """(value, age in seconds) of the latest result, or (None, None) before the first run."""
+        with self._lock:
+            entry = self._snapshot.get(name)
+        if entry is None:
+            return None, None
+        value, updated = entry
+        return value, time.time() - updated
+
+    def versioned(self, name):
+        """(value, version) of the latest result; the version grows by one with every new result,
+        so it can key caches derived from the value. (None, 0) before the first run."""
+        with self._lock:
+            entry = self._snapshot.get(name)
+            return (entry[0] if entry else None), self._versions[name]
+
+    def error(self, name):
+        with self._lock:
+            return self._errors.get(name)
+
+    def refresh_now(self, *names):
+        # Move the jobs to the front of the schedule without blocking the caller
+        with self._lock:
+            for name in names or self.jobs:
+                if self._due[name] != math.inf:
+                    self._due[name] = 0.0
+        self._wake.set()
+
+    def run_job(self, name):
+        func, interval = self.jobs[name]
+        try:
+            value = func()
+        except Exception:
+            with self._lock:
+                self._errors[name] = traceback.format_exc(limit=3)
+        else:
+            with self._lock:
+                self._snapshot[name] = (value, time.time())
+                self._versions[name] += 1
+                self._errors.pop(name, None)
+        finally:
+            with self._lock:
+                self._due[name] = time.time() + interval
+            self._wake.set()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                now = time.time()
+                due = [name for name, at in self._due.items() if at <= now]
+                if self._pool:
+                    for name in due:
+                        self._due[name] = math.inf  # running
+            for name in due:
+                if self._pool:
+                    self._pool.submit(self.run_job, name)
+                else:
+                    self.run_job(name)
+
+            with self._lock:
+                next_due = min(self._due.values())
+            self._wake.wait(timeout=None if next_due == math.inf else max(0.0, next_due - time.time()))
+            self._wake.clear()
@@ -0,0 +1,70 @@
+import functools
+
+import pandas as pd
+
+REGISTRY_PATH = "data/defense_companies.csv"
+COLUMNS = ["name", "ticker", "country", "aliases", "news_query"]
+INDEX_COUNTRY = "Index"
+
+# data/defense_companies.csv is the one list of tracked companies and benchmark indexes.
+# `aliases` holds semicolon-separated other names a company appears under (in news feeds,
+# award notices, older news partitions); `news_query` is its Google News search, left
+# empty for indexes. Every fetcher and the dashboard read it through this module.
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False).reindex(columns=COLUMNS, fill_value="")
+    for col in COLUMNS:
+        df[col] = df[col].str.strip()
+    return df[df["name"] != ""].reset_index(drop=True)
+
+
+def load(path=REGISTRY_PATH):
+    """Every registry row (companies and indexes), read from disk once per process."""
+    return _read(path).copy()
+
+
+def companies(path=REGISTRY_PATH):
+    df = load(path)
+    return df[df["country"] != INDEX_COUNTRY].reset_index(drop=True)
+
+
+def public_companies(path=REGISTRY_PATH):
+    df = companies(path)
+    return df[df["ticker"].str.lower() != "not public"].reset_index(drop=True)
+
+
+def tickers(path=REGISTRY_PATH):
+    return public_companies(path)["ticker"].tolist()
+
+
+def indexes(path=REGISTRY_PATH):
+    """{display name: ticker} for the benchmark indexes, in registry order."""
+    df = load(path)
+    df = df[df["country"] == INDEX_COUNTRY]
+    return dict(zip(df["name"], df["ticker"]))
+
+
+def news_queries(path=REGISTRY_PATH):
+    """{company name: Google News query} for every company with a query."""
+    df = companies(path)
+    df = df[df["news_query"] != ""]
+    return dict(zip(df["name"], df["news_query"]))
+
+
+def aliases(path=REGISTRY_PATH):
+    """{alias: registry name}, including each name mapped to itself."""
+    df = load(path)
+    lookup = {}
+    for name, names in zip(df["name"], df["aliases"]):
+        lookup[name] = name
+        for alias in filter(None, (a.strip() for a in names.split(";"))):
+            lookup.setdefault(alias, name)
+    return lookup
+
+
+def canonical_names(names, path=REGISTRY_PATH):
+    """Registry names for a series of names or aliases; unknown names pass through unchanged."""
+    lookup = aliases(path)
+    return names.map(lambda name: lookup.get(name, name))
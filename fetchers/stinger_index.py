@@ -0,0 +1,135 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fetchers import metrics, price_cache, registry
+from fetchers.atomic import replacing
+from fetchers.fetch_quotes import fetch_quotes
+
+INDEX_DIR = "data/index"
+HORIZONS = ["1d", "5d", "1mo", "3mo", "6mo", "ytd", "1y", "2y", "5y", "10y", "max"]
+WEIGHTINGS = {"equal": "Equal weight", "market_cap": "Market-cap weight"}
+# Listing currency by ticker suffix; everything else (US listings and ADRs) trades in USD.
+# London prices are quoted in pence, but a price ratio does not depend on the unit and market
+# caps are reported in pounds, so only the pound rate is needed.
+LISTING_CURRENCIES = {".PA": "EUR", ".DE": "EUR", ".ST": "SEK", ".OL": "NOK", ".L": "GBP"}
+
+
+def constituents(path=registry.REGISTRY_PATH):
+    return registry.tickers(path)
+
+
+def listing_currency(ticker):
+    return next((cur for suffix, cur in LISTING_CURRENCIES.items() if ticker.endswith(suffix)), "USD")
+
+
+def fx_tickers(tickers):
+    """{currency: yfinance USD rate ticker} for every non-USD listing among `tickers`."""
+    currencies = sorted({listing_currency(t) for t in tickers} - {"USD"})
+    return {cur: f"{cur}USD=X" for cur in currencies}
+
+
+def fx_rates(histories, currencies):
+    """Date x currency USD rates from the price histories of the `fx_tickers` symbols."""
+    return pd.DataFrame({cur: histories[t]["Close"] for cur, t in currencies.items()
+                         if t in histories and not histories[t].empty})
+
+
+def to_usd(closes, market_caps, rates):
+    """(closes, market caps) converted to USD at each date's rate (caps at the latest one).
+
+    Constituents whose currency has no rate come back as NaN, which leaves them out of the
+    market-cap weighting.
+    """
+    caps = pd.Series(market_caps, dtype="float64").reindex(closes.columns)
+    if closes.empty:
+        return closes, caps
+    if not rates.empty:
+        # FX trades on different days than the listings, so take the latest rate on or before each date
+        rates = rates.reindex(closes.index.union(rates.index)).ffill().reindex(closes.index).bfill()
+    rates = rates.reindex(closes.index).assign(USD=1.0)
+    factors = rates.reindex(columns=[listing_currency(t) for t in closes.columns]).set_axis(closes.columns, axis=1)
+    return closes * factors, caps * factors.iloc[-1]
+
+
+def align_closes(histories):
+    """One date x ticker matrix of closes across all trading calendars, forward-filled over
+    exchange holidays and trimmed to the dates on which every constituent has a price."""
+    closes = pd.concat({t: h["Close"] for t, h in histories.items() if not h.empty}, axis=1)
+    return closes.sort_index().ffill().dropna()
+
+
+@metrics.timed("stinger_index.compute")
+def compute_index(closes, weighting="equal", market_caps=None):
+    """Index level (starting at 100) from an aligned close matrix.
+
+    "equal" averages each constituent's return since the first row. "market_cap" is a
+    buy-and-hold portfolio holding each constituent's current share count, derived from its
+    latest market cap and price; closes and caps must be in one currency (see `to_usd`).
+    """
+    if closes.empty:
+        return pd.Series(dtype="float64", name=weighting)
+
+    values = closes.to_numpy(dtype="float64")
+    relative = values / values[0]
+
+    if weighting == "equal":
+        level = relative.mean(axis=1)
+    elif weighting == "market_cap":
+        caps = pd.Series(market_caps, dtype="float64").reindex(closes.columns).to_numpy()
+        shares = caps / values[-1]
+        held = np.isfinite(shares) & (shares > 0) & np.isfinite(values).all(axis=0)
+        if not held.any():
+            return pd.Series(dtype="float64", name=weighting)
+        holdings = values[:, held] @ shares[held]
+        level = holdings / holdings[0]
+    else:
+        raise ValueError(f"Unknown weighting: {weighting}")
+
+    return pd.Series(level * 100, index=closes.index, name=weighting)
+
+
+def index_path(horizon, index_dir=INDEX_DIR):
+    return os.path.join(index_dir, f"stinger_{horizon}.csv")
+
+
+def load_index(horizon, weighting="equal", index_dir=INDEX_DIR):
+    """Persisted index series for `horizon`, or None if the pipeline has not produced it."""
+    try:
+        df = pd.read_csv(index_path(horizon, index_dir), index_col="Date", parse_dates=["Date"])
+    except FileNotFoundError:
+        return None
+    return df[weighting].dropna() if weighting in df.columns else None
+
+
+@metrics.timed("build_indexes")
+def build_indexes(horizons=HORIZONS, index_dir=INDEX_DIR):
+    tickers = constituents()
+    histories = price_cache.get_histories(tickers, "max")
+    closes = align_closes(histories)
+
+    quotes = fetch_quotes(list(closes.columns))
+    currencies = fx_tickers(closes.columns)
+    rates = fx_rates(price_cache.get_histories(list(currencies.values()), "max"), currencies)
+    usd_closes, usd_caps = to_usd(closes, quotes.set_index("Ticker")["Market Cap"], rates)
+
+    os.makedirs(index_dir, exist_ok=True)
+    for horizon in horizons:
+        df = pd.DataFrame({
+            "equal": compute_index(price_cache.slice_period(closes, horizon), "equal"),
+            "market_cap": compute_index(price_cache.slice_period(usd_closes, horizon), "market_cap", usd_caps),
+        })
+        df.index.name = "Date"
+        with replacing(index_path(horizon, index_dir)) as tmp:
+            df.round(4).to_csv(tmp)
+
+    print(f"✅ Built Stinger Defense Index from {closes.shape[1]} constituents for {len(horizons)} horizons.")
+
+
+if __name__ == "__main__":
+    build_indexes()
+    metrics.dump("build_indexes")
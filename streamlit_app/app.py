@@ -1,16 +1,54 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import yfinance as yf
-import re
+import numpy as np
 import sys
 import os
-from streamlit.components.v1 import html
+import time
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from fetchers import metrics, news_store, news_tagging
+from fetchers.fetch_quotes import fetch_quotes
+from fetchers import analytics, price_cache, registry, stinger_index
+from fetchers.memory_cache import CACHE, sizeof
+from fetchers.refresher import Refresher
+from streamlit_app.market_table import MARKET_FORMATS, format_market_table, style_market_table
+
 st.set_page_config(page_title="Stinger Defence", layout="wide")
 
+page_start = time.perf_counter()
+
+# Companies, tickers and indexes all come from the registry (data/defense_companies.csv)
+INDEX_TICKERS = {**registry.indexes(), "Stinger Defense Index": "STINGER_INDEX"}
+
+# One background refresher per server: quotes, price histories and news are pulled on a schedule
+# and every rerun only reads the latest snapshot, so pages never wait on yfinance.
+@st.cache_resource
+def get_refresher():
+    market_tickers = registry.tickers()
+    fx_tickers = list(stinger_index.fx_tickers(market_tickers).values())
+    history_tickers = list(dict.fromkeys(market_tickers + list(registry.indexes().values()) + fx_tickers))
+
+    def refresh_histories():
+        price_cache.refresh_stale(history_tickers)
+        return history_tickers
+
+    refresher = Refresher({
+        "news": (news_store.load_news, 5 * 60),
+        "quotes": (lambda: fetch_quotes(market_tickers), 60),
+        "histories": (refresh_histories, price_cache.MAX_AGE),
+    })
+    # News is a local read, so the first page can have it straight away
+    refresher.run_job("news")
+    return refresher.start()
+
+refresher = get_refresher()
+
+def age_caption(age):
+    if age < 60:
+        return f"{age:.0f}s ago"
+    return f"{age / 60:.0f} min ago"
+
 st.title("Stinger Defence")
 st.caption("Global Defense Market Dashboard — Stocks, News & Companies")
 # ===== CUSTOM STYLES =====
@@ -22,12 +60,6 @@ st.markdown("""
     margin-bottom: 2em;
     width: 100%;
 }
-.red-down { color: red; font-weight: normal; }
-.green-up { color: green; font-weight: bold; }
-.positive { color: green; font-weight: bold; }
-.negative { color: red; }
-td, th { padding: 6px 12px; text-align: left; }
-table { width: 100%; border-collapse: collapse; }
 </style>
 """, unsafe_allow_html=True)
 
@@ -67,190 +99,157 @@ No significant conflict emerged today, allowing markets to focus on strategic bu
 st.markdown('<div id="news"></div>', unsafe_allow_html=True)
 st.subheader("Latest Defense News")
 
-import re
-import pandas as pd
-
-@st.cache_data(ttl=1800)
+@metrics.timed("app.load_news")
 def load_news():
-    try:
-        return pd.read_csv("data/defense_news.csv")
-    except FileNotFoundError:
-        return pd.DataFrame()
+    # (news, snapshot version); the version keys everything derived from this snapshot
+    news, version = refresher.versioned("news")
+    return (news if news is not None else pd.DataFrame()), version
+
+@st.cache_resource(max_entries=1)
+def news_company_index(_news_df, snapshot_version):
+    # Snapshots arrive typed and sorted newest first, so each company's rows are already in page order
+    return news_store.company_index(_news_df)
+
+@st.cache_resource(max_entries=1)
+def news_tag_matrix(_news_df, snapshot_version):
+    # Rebuilt only when the refresher publishes a new news snapshot
+    return news_tagging.tag_matrix(_news_df["tags"])
+
+NEWS_PAGE_SIZE = 20
+
+CONTRACT_VALUE_FILTERS = {
+    "Any": None,
+    "Mentions a value": 0,
+    "$100 million+": 1e8,
+    "$1 billion+": 1e9,
+}
 
 # Full list of defense companies (always shown in dropdown)
-valid_companies = sorted([
-    "Lockheed Martin", "Raytheon Technologies", "Northrop Grumman", "General Dynamics",
-    "L3Harris Technologies", "Huntington Ingalls Industries", "Textron", "Leidos",
-    "Mercury Systems", "Kratos Defense", "Curtiss-Wright", "CACI International",
-    "Boeing", "Oshkosh Corporation", "BAE Systems", "Thales", "Rheinmetall",
-    "Saab AB", "Leonardo S.p.A.", "Kongsberg Gruppen", "Airbus", "Dassault Aviation",
-    "Hensoldt AG", "Elbit Systems", "Babcock International", "Serco Group",
-    "Rolls-Royce Holdings", "QinetiQ Group", "MTU Aero Engines"
-])
-
-news_df = load_news()
-
-if news_df.empty:
-    st.warning("No news data found.")
-else:
-    news_df["company"] = news_df["company"].astype(str).str.strip()
-    selected_company = st.selectbox("Filter by Company", ["All"] + valid_companies)
-
-    if selected_company == "All":
-        filtered = news_df
-    else:
-        filtered = news_df[news_df["company"].str.strip() == selected_company]
+valid_companies = sorted(registry.companies()["name"])
 
-    filtered = filtered.sort_values(by="published", ascending=False)
-    show_all = st.toggle("Show All News", value=False)
-    news_to_show = filtered if show_all else filtered.head(5)
+# Each section is a fragment: a widget change reruns only the section it belongs to
+@st.fragment
+@metrics.timed("app.news_section")
+def news_section():
+    news_snapshot, news_version = load_news()
 
-    if filtered.empty:
-        st.info(f"No news found for {selected_company}.")
+    if news_snapshot.empty:
+        st.warning("No news data found.")
     else:
-        st.caption(f"Showing {'all' if show_all else 'latest 5'} news items for **{selected_company}**")
+        news_df = news_snapshot
+        selected_company = st.selectbox("Filter by Company", ["All"] + valid_companies)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_tags = st.multiselect("Filter by Tag", news_tagging.KEYWORDS)
+        with col2:
+            value_filter = st.selectbox("Contract Value", list(CONTRACT_VALUE_FILTERS))
+
+        # Tags and amounts are computed at ingestion; filtering narrows an array of row positions
+        if selected_company == "All":
+            matches = np.arange(len(news_df))
+        else:
+            matches = news_company_index(news_df, news_version).get(selected_company, np.array([], dtype=int))
+        if selected_tags:
+            tags = news_tag_matrix(news_df, news_version)
+            matches = matches[tags[selected_tags].to_numpy()[matches].any(axis=1)]
+        min_value = CONTRACT_VALUE_FILTERS[value_filter]
+        if min_value is not None:
+            matches = matches[news_df["contract_value"].to_numpy()[matches] >= min_value]
+
+        show_all = st.toggle("Show All News", value=False)
+
+        if len(matches) == 0:
+            st.info(f"No news found for {selected_company}.")
+        else:
+            if show_all:
+                page_count = -(-len(matches) // NEWS_PAGE_SIZE)
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+                first = (page - 1) * NEWS_PAGE_SIZE
+                page_rows = matches[first:first + NEWS_PAGE_SIZE]
+                st.caption(f"Showing items {first + 1}–{first + len(page_rows)} of {len(matches)} "
+                           f"(page {page} of {page_count}) for **{selected_company}**")
+            else:
+                page_rows = matches[:5]
+                st.caption(f"Showing latest 5 news items for **{selected_company}**")
 
-        for _, row in news_to_show.iterrows():
-            with st.container():
-                st.markdown(f"### [{row['title']}]({row['link']})")
-                st.caption(f"{row['published']} — {row['company']}")
+            # Only the visible page is materialized and rendered
+            for _, row in news_df.iloc[page_rows].iterrows():
+                with st.container():
+                    st.markdown(f"### [{row['title']}]({row['link']})")
+                    published = row["published"].strftime("%a, %d %b %Y %H:%M UTC") if pd.notna(row["published"]) else "Undated"
+                    st.caption(f"{published} — {row['company']}")
 
-                summary_parts = []
+                    summary_parts = []
 
-                if re.search(r"\$\d+[\.\d]*\s*(million|billion)?", row["title"], re.IGNORECASE):
-                    summary_parts.append("Possible contract value mentioned.")
+                    if pd.notna(row["contract_value"]):
+                        summary_parts.append(f"Possible contract value mentioned: {news_tagging.format_amount(row['contract_value'])}.")
 
-                keywords = ["missile", "radar", "ship", "drone", "contract", "aircraft", "satellite", "cyber", "$", "million", "billion"]
-                matches = [kw for kw in keywords if re.search(kw, row["title"], re.IGNORECASE)]
+                    if row["tags"]:
+                        summary_parts.append("Keywords: " + row["tags"].replace(";", ", "))
 
-                if matches:
-                    summary_parts.append("Keywords: " + ", ".join(matches))
+                    if summary_parts:
+                        st.markdown("**Summary Insight:** " + " | ".join(summary_parts))
 
-                if summary_parts:
-                    st.markdown("**Summary Insight:** " + " | ".join(summary_parts))
+                    st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
 
-                st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
+news_section()
 
 # ========== MARKET & COMPANIES OVERVIEW ==========
 st.markdown('<div id="market"></div>', unsafe_allow_html=True)
 st.subheader("Market & Companies Overview (Live)")
 st.caption("Includes real-time price, % change, volume, market cap, P/E ratio, 52-week change — click Refresh to update")
 
-# Manual refresh button
-if st.button("Refresh Now"):
-    st.rerun()
-@st.cache_data(ttl=10)
-def fetch_live_data():
-    df = pd.read_csv("data/defense_companies.csv")
-    df = df[df["ticker"].str.lower() != "not public"]
-    # EXCLUDE index tickers before processing
-    exclude_tickers = ["^GSPC", "^NDX", "^DJI", "^RUT", "^FTSE", "^STOXX50E", "^GDAXI", "^FCHI", "^N225", "^HSI", "STINGER_INDEX"]
-    df = df[~df["ticker"].isin(exclude_tickers)]
-
-    data = []
-    for _, row in df.iterrows():
-        try:
-            stock = yf.Ticker(row["ticker"])
-            info = stock.info
-            current = {
-                "Company": row["name"],
-                "Ticker": row["ticker"],
-                "Price": info.get("regularMarketPrice", "N/A"),
-                "Change %": info.get("regularMarketChangePercent", 0.0),
-                "Volume": info.get("volume", "N/A"),
-                "Market Cap": info.get("marketCap", "N/A"),
-                "P/E Ratio": info.get("trailingPE", "N/A"),
-                "52W Change": info.get("52WeekChange", "N/A")
-            }
-            data.append(current)
-        except:
-            continue
-
-    df_live = pd.DataFrame(data)
-    df_live["Indicator"] = df_live["Change %"].apply(
-        lambda x: f"<span class='green-up'>&#9650;</span>" if isinstance(x, float) and x > 0 else (
-                  f"<span class='red-down'>&#9660;</span>" if isinstance(x, float) and x < 0 else "")
-    )
-    df_live["Change % Raw"] = df_live["Change %"]
-    df_live["Change %"] = df_live["Change %"].apply(lambda x: f"{x:.2f}%" if isinstance(x, float) else "N/A")
-    df_live["Price"] = df_live["Price"].apply(lambda x: f"${x:,.2f}" if isinstance(x, (float, int)) else "N/A")
-    df_live["Volume"] = df_live["Volume"].apply(lambda x: f"{int(x):,}" if isinstance(x, (int, float)) else "N/A")
-    df_live["Market Cap"] = df_live["Market Cap"].apply(lambda x: f"${int(x):,}" if isinstance(x, (int, float)) else "N/A")
-    df_live["P/E Ratio"] = df_live["P/E Ratio"].apply(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) else "N/A")
-    df_live["52W Change"] = df_live["52W Change"].apply(lambda x: f"{x*100:.2f}%" if isinstance(x, float) else "N/A")
+@metrics.timed("app.fetch_live_data")
+def fetch_live_data(quotes_snapshot):
+    if quotes_snapshot is None:
+        raise RuntimeError("market data is still loading in the background")
+
+    df = registry.public_companies()
+    df_live = df.rename(columns={"name": "Company", "ticker": "Ticker"})[["Company", "Ticker"]]
+    df_live = df_live.merge(quotes_snapshot.drop(columns=["Beta"]), on="Ticker", how="inner")
+
     return df_live
 
-# ======================== Display Section ========================
+@st.fragment
+@metrics.timed("app.market_section")
+def market_section():
+    # Manual refresh button: asks the background refresher to run now, without blocking this rerun
+    if st.button("Refresh Now"):
+        refresher.refresh_now("quotes")
+        st.toast("Refresh requested — new quotes appear on the next rerun.")
 
-def render_table(df):
-    def colorize(val):
-        try:
-            if isinstance(val, str) and "%" in val:
-                num = float(val.strip('%').replace(',', ''))
-            elif isinstance(val, str) and val.startswith('$'):
-                num = float(val.strip('$').replace(',', ''))
-            else:
-                num = float(val)
-            css = "positive" if num > 0 else "negative"
-            return f"<td class='{css}'>{val}</td>"
-        except:
-            return f"<td>{val}</td>"
-
-    headers = ''.join(f"<th>{col}</th>" for col in df.columns if col != "Change % Raw")
-    rows = []
-    for _, row in df.iterrows():
-        html_row = "<tr>"
-        for col in df.columns:
-            if col == "Change % Raw":
-                continue
-            html_row += colorize(row[col])
-        html_row += "</tr>"
-        rows.append(html_row)
-    return f"<table><thead><tr>{headers}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
-
-try:
-    df_live_display = fetch_live_data()
-
-    # ====== Company Search ======
-    st.markdown("#### Filter Companies by Name")
-    company_search = st.text_input("Enter full or partial name:")
-    if company_search:
-        df_live_display = df_live_display[df_live_display["Company"].str.contains(company_search, case=False)]
-
-    # ====== Sorting Options ======
-    sort_options = ["Change %", "Price", "Volume", "Market Cap", "P/E Ratio", "52W Change"]
-    sort_by = st.selectbox("Sort by metric:", sort_options, index=0)
-    ascending = st.radio("Sort order:", ["Descending", "Ascending"]) == "Ascending"
-
-    sort_col_map = {
-        "Change %": "Change % Raw",
-        "Price": "Price",
-        "Volume": "Volume",
-        "Market Cap": "Market Cap",
-        "P/E Ratio": "P/E Ratio",
-        "52W Change": "52W Change"
-    }
-    sort_col = sort_col_map[sort_by]
-    df_live_display = df_live_display.sort_values(by=sort_col, ascending=ascending)
-
-    df_live_display.drop(columns=["Change % Raw"], inplace=True)
-
-    # ====== Table Display ======
-    st.markdown("""
-    <style>
-    .stDataFrame tbody td div { font-size: 15px; }
-    table { width: 100%; border-collapse: collapse; margin-top: 1em; }
-    th { text-align: left; padding: 6px 10px; font-weight: bold; border-bottom: 1px solid #444; }
-    td { padding: 6px 10px; }
-    .positive { color: green; font-weight: bold; }
-    .negative { color: red; }
-    </style>
-    """, unsafe_allow_html=True)
-
-    st.write(render_table(df_live_display), unsafe_allow_html=True)
-
-except Exception as e:
-    st.warning(f"Live stock data unavailable. Error: {e}")
+    quotes_snapshot, quotes_age = refresher.get("quotes")
+    if quotes_age is not None:
+        st.caption(f"Quotes updated {age_caption(quotes_age)}")
+
+    try:
+        df_live_display = fetch_live_data(quotes_snapshot)
+
+        # ====== Company Search ======
+        st.markdown("#### Filter Companies by Name")
+        company_search = st.text_input("Enter full or partial name:")
+        if company_search:
+            df_live_display = df_live_display[df_live_display["Company"].str.contains(company_search, case=False)]
+
+        # ====== Sorting Options ======
+        sort_options = ["Change %", "Price", "Volume", "Market Cap", "P/E Ratio", "52W Change"]
+        sort_by = st.selectbox("Sort by metric:", sort_options, index=0)
+        ascending = st.radio("Sort order:", ["Descending", "Ascending"]) == "Ascending"
+
+        df_live_display = df_live_display.sort_values(by=sort_by, ascending=ascending, na_position="last")
+
+        # ====== Table Display ======
+        # Numbers go to the browser as numbers and are formatted there; the Styler only adds the colours
+        st.dataframe(
+            style_market_table(format_market_table(df_live_display)), use_container_width=True, hide_index=True,
+            column_config={col: st.column_config.NumberColumn(format=fmt) for col, fmt in MARKET_FORMATS.items()},
+        )
+
+    except Exception as e:
+        st.warning(f"Live stock data unavailable. Error: {e}")
+
+market_section()
 
 # ===== MARKET & COMPANIES NOTE =====
 st.markdown("### Market & Companies Note")
@@ -266,113 +265,109 @@ st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
 # ========== COMPANIES SECTION ==========
 st.subheader("Global Defense Companies")
 
-try:
-    df_companies = pd.read_csv("data/defense_companies.csv")
-    col1, col2 = st.columns(2)
+@st.fragment
+@metrics.timed("app.companies_section")
+def companies_section():
+    import plotly.express as px
 
-    with col1:
-        filter_country = st.multiselect("Filter by Country", sorted(df_companies["country"].unique()))
-    with col2:
-        search_term = st.text_input("Search Company Name")
-
-    df_filtered = df_companies.copy()
-    if filter_country:
-        df_filtered = df_filtered[df_filtered["country"].isin(filter_country)]
-    if search_term:
-        df_filtered = df_filtered[df_filtered["name"].str.contains(search_term, case=False)]
-
-    st.dataframe(df_filtered, use_container_width=True)
-    fig = px.histogram(df_filtered, x="country", title="Number of Companies by Country")
-    st.plotly_chart(fig, use_container_width=True)
-except:
-    st.warning("Company data not available.")
+    try:
+        df_companies = registry.load()[["name", "ticker", "country"]]
+        col1, col2 = st.columns(2)
+
+        with col1:
+            filter_country = st.multiselect("Filter by Country", sorted(df_companies["country"].unique()))
+        with col2:
+            search_term = st.text_input("Search Company Name")
+
+        df_filtered = df_companies.copy()
+        if filter_country:
+            df_filtered = df_filtered[df_filtered["country"].isin(filter_country)]
+        if search_term:
+            df_filtered = df_filtered[df_filtered["name"].str.contains(search_term, case=False)]
+
+        st.dataframe(df_filtered, use_container_width=True)
+        fig = px.histogram(df_filtered, x="country", title="Number of Companies by Country")
+        st.plotly_chart(fig, use_container_width=True)
+    except:
+        st.warning("Company data not available.")
+
+companies_section()
 st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
 
 # ========== STOCK TRACKER ==========
 st.subheader("Stock & Index Tracker")
 
-try:
-    df_stocks = pd.read_csv("data/defense_companies.csv")
-    df_stocks = df_stocks[df_stocks["ticker"].str.lower() != "not public"]
-    stock_name_to_ticker = {row["name"]: row["ticker"] for _, row in df_stocks.iterrows()}
-
-    index_tickers = {
-        "S&P 500": "^GSPC", "Nasdaq 100": "^NDX", "Dow Jones": "^DJI",
-        "Russell 2000": "^RUT", "FTSE 100": "^FTSE", "Euro Stoxx 50": "^STOXX50E",
-        "DAX": "^GDAXI", "CAC 40": "^FCHI", "Nikkei 225": "^N225", "Hang Seng": "^HSI",
-        "Stinger Defense Index": "STINGER_INDEX"
-    }
-
-    col1, col2 = st.columns(2)
-    with col1:
-        selected_stocks = st.multiselect("Select Defense Companies", list(stock_name_to_ticker.keys()))
-    with col2:
-        selected_indexes = st.multiselect("Select Indexes", list(index_tickers.keys()))
-
-    col3, col4 = st.columns(2)
-    with col3:
-        horizon = st.selectbox("Time Range", [
-            "1d", "5d", "1mo", "3mo", "6mo",
-            "ytd", "1y", "2y", "5y", "10y", "max"
-        ])
-    with col4:
-        normalize = st.checkbox("Normalize Prices (Start at 100%)", value=False)
-
-    if selected_stocks or selected_indexes:
-        fig = px.line(title="Price Comparison")
-        skipped = []
-
-        for name in selected_stocks:
-            ticker = stock_name_to_ticker[name]
-            try:
-                data = yf.Ticker(ticker).history(period=horizon)
-                if not data.empty:
-                    series = data["Close"]
-                    if normalize:
-                        series = (series / series.iloc[0]) * 100
-                    fig.add_scatter(x=series.index, y=series, mode="lines", name=name)
-                else:
-                    skipped.append(name)
-            except:
-                skipped.append(name)
-
-        for name in selected_indexes:
-            ticker = index_tickers[name]
-
-            if ticker == "STINGER_INDEX":
-                try:
-                    index_series_list = []
-                    for stock_name, stock_ticker in stock_name_to_ticker.items():
-                        try:
-                            data = yf.Ticker(stock_ticker).history(period=horizon)["Close"]
-                            if not data.empty:
-                                norm_series = (data / data.iloc[0]) * 100
-                                norm_series.name = stock_name
-                                index_series_list.append(norm_series)
-                        except:
-                            continue
-
-                    if index_series_list:
-                        combined_df = pd.concat(index_series_list, axis=1)
-                        combined_df = combined_df.fillna(method="ffill").dropna()
-                        combined_index = combined_df.mean(axis=1)
+def load_stinger_index(horizon, weighting):
+    # Held in the size-bounded memory cache, shared with the price histories below
+    return CACHE.get_or_load(("stinger_index", horizon, weighting),
+                             lambda: _build_stinger_index(horizon, weighting), ttl=1800)
+
+def _build_stinger_index(horizon, weighting):
+    # Precomputed by fetchers/stinger_index.py; fall back to the local price cache if missing
+    series = stinger_index.load_index(horizon, weighting)
+    metrics.count("hits" if series is not None else "misses", "stinger_index.precomputed")
+    if series is None:
+        histories = price_cache.read_histories(stinger_index.constituents(), "max", memory=CACHE)
+        closes = price_cache.slice_period(stinger_index.align_closes(histories), horizon)
+        market_caps = None
+        quotes_snapshot, _ = refresher.get("quotes")
+        if weighting == "market_cap" and quotes_snapshot is not None:
+            currencies = stinger_index.fx_tickers(closes.columns)
+            rates = stinger_index.fx_rates(
+                price_cache.read_histories(list(currencies.values()), "max", memory=CACHE), currencies
+            )
+            closes, market_caps = stinger_index.to_usd(closes, quotes_snapshot.set_index("Ticker")["Market Cap"], rates)
+        series = stinger_index.compute_index(closes, weighting, market_caps)
+    return series
+
+@st.fragment
+@metrics.timed("app.tracker_section")
+def tracker_section():
+    import plotly.express as px
+
+    quotes_snapshot, _ = refresher.get("quotes")
 
-                        if normalize:
-                            combined_index = (combined_index / combined_index.iloc[0]) * 100
-
-                        fig.add_scatter(
-                            x=combined_index.index,
-                            y=combined_index.values,
-                            mode="lines",
-                            name="Stinger Defense Index"
-                        )
-                    else:
-                        skipped.append("Stinger Defense Index")
-                except:
-                    skipped.append("Stinger Defense Index")
-            else:
+    try:
+        df_stocks = registry.public_companies()
+        stock_name_to_ticker = {row["name"]: row["ticker"] for _, row in df_stocks.iterrows()}
+
+        index_tickers = INDEX_TICKERS
+
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_stocks = st.multiselect("Select Defense Companies", list(stock_name_to_ticker.keys()))
+        with col2:
+            selected_indexes = st.multiselect("Select Indexes", list(index_tickers.keys()))
+
+        col3, col4 = st.columns(2)
+        with col3:
+            horizon = st.selectbox("Time Range", [
+                "1d", "5d", "1mo", "3mo", "6mo",
+                "ytd", "1y", "2y", "5y", "10y", "max"
+            ])
+        with col4:
+            normalize = st.checkbox("Normalize Prices (Start at 100%)", value=False)
+
+        stinger_weighting = "equal"
+        if "Stinger Defense Index" in selected_indexes:
+            stinger_weighting = st.radio(
+                "Stinger Defense Index weighting", list(stinger_index.WEIGHTINGS),
+                format_func=stinger_index.WEIGHTINGS.get, horizontal=True
+            )
+
+        if selected_stocks or selected_indexes:
+            fig = px.line(title="Price Comparison")
+            skipped = []
+            # Local reads only; the background refresher keeps the price cache up to date
+            histories = price_cache.read_histories(
+                [stock_name_to_ticker[n] for n in selected_stocks] + [index_tickers[n] for n in selected_indexes],
+                horizon, memory=CACHE
+            )
+
+            for name in selected_stocks:
+                ticker = stock_name_to_ticker[name]
                 try:
-                    data = yf.Ticker(ticker).history(period=horizon)
+                    data = histories.get(ticker, pd.DataFrame())
                     if not data.empty:
                         series = data["Close"]
                         if normalize:
@@ -383,36 +378,152 @@ try:
                 except:
                     skipped.append(name)
 
-        if skipped:
-            st.warning(f"Skipped: {', '.join(skipped)}")
+            for name in selected_indexes:
+                ticker = index_tickers[name]
+
+                if ticker == "STINGER_INDEX":
+                    try:
+                        combined_index = load_stinger_index(horizon, stinger_weighting)
+
+                        if combined_index is not None and not combined_index.empty:
+                            if normalize:
+                                combined_index = (combined_index / combined_index.iloc[0]) * 100
+
+                            fig.add_scatter(
+                                x=combined_index.index,
+                                y=combined_index.values,
+                                mode="lines",
+                                name=f"Stinger Defense Index ({stinger_index.WEIGHTINGS[stinger_weighting]})"
+                            )
+                        else:
+                            skipped.append("Stinger Defense Index")
+                    except:
+                        skipped.append("Stinger Defense Index")
+                else:
+                    try:
+                        data = histories.get(ticker, pd.DataFrame())
+                        if not data.empty:
+                            series = data["Close"]
+                            if normalize:
+                                series = (series / series.iloc[0]) * 100
+                            fig.add_scatter(x=series.index, y=series, mode="lines", name=name)
+                        else:
+                            skipped.append(name)
+                    except:
+                        skipped.append(name)
 
-        st.plotly_chart(fig, use_container_width=True, key="main_price_chart")
+            if skipped:
+                _, history_age = refresher.get("histories")
+                note = "" if history_age is not None else " (price history is still loading in the background)"
+                st.warning(f"Skipped: {', '.join(skipped)}{note}")
 
-        if "Stinger Defense Index" in selected_indexes:
-            st.caption("The Stinger Defense Index is an informational, equal-weighted index of select global defense companies.")
-
-        # ========== Dynamic Fundamentals Based on Horizon (Multiple Stocks) ==========
-        if selected_stocks:
-            st.markdown(f"## Fundamentals for Selected Stocks ({horizon})")
-
-            for selected_name in selected_stocks:
-                ticker = stock_name_to_ticker[selected_name]
-                ticker_obj = yf.Ticker(ticker)
-                hist = ticker_obj.history(period=horizon)
-
-                if not hist.empty:
-                    price_change = ((hist["Close"].iloc[-1] - hist["Close"].iloc[0]) / hist["Close"].iloc[0]) * 100
-                    latest_volume = hist["Volume"].iloc[-1] if "Volume" in hist.columns else "N/A"
-                    info = ticker_obj.info
-
-                    st.markdown(f"### {selected_name}")
-                    col1, col2, col3, col4 = st.columns(4)
-                    col1.metric("Price Change", f"{price_change:.2f}%", delta=f"{hist['Close'].iloc[-1] - hist['Close'].iloc[0]:.2f}")
-                    col2.metric("Volume", f"{latest_volume:,}" if latest_volume != "N/A" else "N/A")
-                    col3.metric("Market Cap", f"${info.get('marketCap', 'N/A'):,}" if isinstance(info.get('marketCap'), int) else "N/A")
-                    col4.metric("Beta", f"{info.get('beta', 'N/A')}")
-                    st.markdown("---")
-    else:
-        st.info("Select at least one company or index to compare.")
-except Exception as e:
-    st.error(f"Could not load data: {e}")
+            st.plotly_chart(fig, use_container_width=True, key="main_price_chart")
+
+            if "Stinger Defense Index" in selected_indexes:
+                st.caption("The Stinger Defense Index is an informational index of select global defense companies, equal- or market-cap-weighted.")
+
+            # ========== Dynamic Fundamentals Based on Horizon (Multiple Stocks) ==========
+            if selected_stocks:
+                st.markdown(f"## Fundamentals for Selected Stocks ({horizon})")
+
+                quotes_by_ticker = quotes_snapshot.set_index("Ticker") if quotes_snapshot is not None else pd.DataFrame()
+
+                for selected_name in selected_stocks:
+                    ticker = stock_name_to_ticker[selected_name]
+                    hist = histories.get(ticker, pd.DataFrame())
+
+                    if not hist.empty:
+                        price_change = ((hist["Close"].iloc[-1] - hist["Close"].iloc[0]) / hist["Close"].iloc[0]) * 100
+                        latest_volume = int(hist["Volume"].iloc[-1]) if "Volume" in hist.columns else "N/A"
+                        info = quotes_by_ticker.loc[ticker] if ticker in quotes_by_ticker.index else pd.Series(dtype="float64")
+
+                        st.markdown(f"### {selected_name}")
+                        col1, col2, col3, col4 = st.columns(4)
+                        col1.metric("Price Change", f"{price_change:.2f}%", delta=f"{hist['Close'].iloc[-1] - hist['Close'].iloc[0]:.2f}")
+                        col2.metric("Volume", f"{latest_volume:,}" if latest_volume != "N/A" else "N/A")
+                        col3.metric("Market Cap", f"${int(info['Market Cap']):,}" if pd.notna(info.get("Market Cap")) else "N/A")
+                        col4.metric("Beta", f"{info['Beta']:.2f}" if pd.notna(info.get("Beta")) else "N/A")
+                        st.markdown("---")
+        else:
+            st.info("Select at least one company or index to compare.")
+    except Exception as e:
+        st.error(f"Could not load data: {e}")
+
+tracker_section()
+st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
+
+# ========== SECTOR ANALYTICS ==========
+st.subheader("Sector Analytics")
+
+def load_analytics(horizon):
+    # Precomputed by fetchers/analytics.py; keyed by file mtimes so each rebuild replaces the cached copy
+    try:
+        mtimes = (os.path.getmtime(analytics.summary_path(horizon)), os.path.getmtime(analytics.correlation_path(horizon)))
+    except FileNotFoundError:
+        return None
+    key = ("analytics", horizon, mtimes)
+    result = CACHE.get(key)
+    if result is None:
+        result = analytics.load_analytics(horizon)
+        if result is not None:
+            CACHE.discard(key[:2])
+            CACHE.put(key, result)
+    return result
+
+@st.fragment
+@metrics.timed("app.analytics_section")
+def analytics_section():
+    import plotly.express as px
+
+    benchmarks = list(registry.indexes())
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        horizon = st.selectbox("Period", analytics.HORIZONS, index=analytics.HORIZONS.index("1y"), key="analytics_horizon")
+    with col2:
+        benchmark = st.selectbox("Beta against", benchmarks)
+    with col3:
+        rank_by = st.selectbox("Rank by", ["Return %", "Volatility %", "Max Drawdown %", "Drawdown %", "Beta"])
+
+    result = load_analytics(horizon)
+    if result is None:
+        st.info("Sector analytics have not been built yet; they are refreshed with the market data.")
+        return
+    summary, correlation = result
+
+    ranking = summary[["Company", "Return %", "Volatility %", "Max Drawdown %", "Drawdown %"]].copy()
+    ranking["Beta"] = summary.get(f"Beta {benchmark}")
+    ranking = ranking.sort_values(rank_by, ascending=False).reset_index()
+    st.dataframe(ranking.round(2), use_container_width=True, hide_index=True)
+
+    names = summary["Company"].to_dict()
+    fig = px.imshow(
+        correlation.rename(index=names, columns=names), zmin=-1, zmax=1,
+        color_continuous_scale="RdBu", title=f"Correlation of Daily Returns ({horizon})"
+    )
+    fig.update_layout(height=700)
+    st.plotly_chart(fig, use_container_width=True, key="correlation_heatmap")
+
+analytics_section()
+
+metrics.REGISTRY.observe("app.page", time.perf_counter() - page_start)
+
+# ========== ADMIN: PERFORMANCE (hidden, open with ?admin=1) ==========
+if st.query_params.get("admin") == "1":
+    st.markdown("<div class='yellow-divider'></div>", unsafe_allow_html=True)
+    st.subheader("Admin: Performance")
+    st.caption("Per-stage latency in this server process (dashboard and background refresher), most recent samples.")
+    st.dataframe(metrics.summary().round(2), use_container_width=True, hide_index=True)
+
+    stats = CACHE.stats()
+    st.caption(
+        f"Memory cache: {stats['resident MB']:.1f} of {stats['budget MB']:.0f} MB resident in {stats['entries']} entries, "
+        f"hit rate {stats['hit rate']:.0%}, {stats['evictions']} evictions (budget set by STINGER_CACHE_MB). "
+        f"News snapshot: {sizeof(load_news()[0]) / 2**20:.1f} MB."
+    )
+    st.dataframe(CACHE.usage().round(2), use_container_width=True, hide_index=True)
+
+    for job, text in metrics.read_dumps().items():
+        with st.expander(f"Fetcher metrics: {job}"):
+            st.code(text, language="text")
+
+    st.download_button("Download Prometheus metrics", metrics.REGISTRY.to_prometheus(), file_name="stinger_metrics.prom")
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from fetchers import metrics
+
+# Presentation layer: the market table stays numeric (so sorting is numeric) and is never turned
+# into strings on the server; st.dataframe formats each column in the browser with these
+# st.column_config.NumberColumn formats (printf-style, or "percent" for fractions).
+MARKET_FORMATS = {
+    "Price": "$%,.2f",
+    "Change %": "%.2f%%",
+    "Volume": "%,d",
+    "Market Cap": "$%,d",
+    "P/E Ratio": "%.2f",
+    "52W Change": "percent",
+}
+# Cells coloured green/red by direction, each mapped to the column whose sign decides it
+DIRECTION_COLORED = {"Change %": "Change %", "52W Change": "52W Change", "Indicator": "Change %"}
+UP_CSS = "color: green; font-weight: bold"
+DOWN_CSS = "color: red"
+
+
+@metrics.timed("app.format_market_table")
+def format_market_table(df):
+    """The numeric market table plus an up/down Indicator column for today's change."""
+    change_sign = np.sign(df["Change %"].to_numpy(dtype="float64"))
+    return df.assign(Indicator=np.where(change_sign > 0, "▲", np.where(change_sign < 0, "▼", "")))
+
+
+def _direction_css(table):
+    signs = np.sign(table[list(DIRECTION_COLORED.values())].to_numpy(dtype="float64"))
+    css = np.where(signs > 0, UP_CSS, np.where(signs < 0, DOWN_CSS, ""))
+    return pd.DataFrame(css, index=table.index, columns=list(DIRECTION_COLORED))
+
+
+def style_market_table(table):
+    """A Styler colouring the direction columns of a format_market_table() frame.
+
+    The CSS for all cells is one np.where over the signs; the values themselves are still
+    formatted in the browser, since column_config formats take precedence over the Styler's.
+    """
+    return table.style.apply(_direction_css, axis=None, subset=list(DIRECTION_COLORED))
@@ -0,0 +1,9 @@
+import os
+
+from benchmarks.stub_server import FIXTURES_DIR
+
+
+def read_fixture(name):
+    """Text of a recorded page in benchmarks/fixtures."""
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fetchers import analytics
+
+DATES = pd.bdate_range("2024-01-01", periods=120)
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(rng.normal(0, 0.01, (len(DATES), 4)), DATES, ["A", "B", "C", "D"])
+    df.iloc[:50, 1] = np.nan  # listed later
+    df.iloc[[10, 40, 90], 2] = np.nan  # missing days
+    df.iloc[:-1, 3] = np.nan  # a single return
+    return df
+
+
+def test_pairwise_moments_match_pandas_with_gaps(returns):
+    cov, corr, _ = analytics.pairwise_moments(returns, returns)
+
+    pd.testing.assert_frame_equal(cov, returns.cov())
+    pd.testing.assert_frame_equal(corr, returns.corr())
+
+
+def test_pairwise_moments_without_gaps_match_pandas(returns):
+    complete = returns[["A"]].assign(E=returns["A"] * 2 + 0.001)
+
+    cov, corr, var_b = analytics.pairwise_moments(complete, complete[["A"]])
+
+    pd.testing.assert_frame_equal(cov, complete.cov()[["A"]])
+    pd.testing.assert_frame_equal(corr, complete.corr()[["A"]])
+    assert var_b.to_numpy() == pytest.approx(complete["A"].var())
+
+
+def test_beta_of_a_truncated_benchmark_copy_is_one():
+    rng = np.random.default_rng(3)
+    closes = pd.DataFrame({"BENCH": 100 * np.cumprod(1 + rng.normal(0, 0.01, len(DATES)))}, DATES)
+    # A ticker with the benchmark's own prices, listed halfway through the window
+    closes["COPY"] = closes["BENCH"].where(DATES >= DATES[60])
+
+    summary, _ = analytics.compute_analytics(closes, ["COPY"], {"Bench": "BENCH"})
+
+    assert summary.loc["COPY", "Beta Bench"] == pytest.approx(1.0)
@@ -0,0 +1,50 @@
+import http.client
+import urllib.request
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from fetchers import feed_engine
+
+ROUTES = {"/rss/search": ("google_news.rss", "application/rss+xml")}
+
+
+@pytest.fixture
+def stub():
+    with StubServer(ROUTES) as server:
+        yield server
+
+
+@pytest.fixture
+def flaky_urlopen(monkeypatch):
+    """urlopen that truncates the first response for "q=flaky" and raises ValueError for "q=broken"."""
+    urlopen = urllib.request.urlopen
+    failures = {"flaky": 1}
+
+    def fake_urlopen(request, timeout=None):
+        if "q=broken" in request.full_url:
+            raise ValueError("unexpected upstream payload")
+        if "q=flaky" in request.full_url and failures["flaky"]:
+            failures["flaky"] -= 1
+            raise http.client.IncompleteRead(b"<rss>", 1024)
+        return urlopen(request, timeout=timeout)
+
+    monkeypatch.setattr(feed_engine.urllib.request, "urlopen", fake_urlopen)
+
+
+def test_truncated_response_is_retried(stub, flaky_urlopen):
+    result = feed_engine.fetch_feed(f"{stub.base_url}/rss/search?q=flaky", backoff=0)
+
+    assert result["error"] is None
+    assert result["status"] == 200
+    assert result["entries"]
+
+
+def test_one_failing_feed_does_not_abort_the_batch(stub, flaky_urlopen):
+    urls = [f"{stub.base_url}/rss/search?q={q}" for q in ("ok", "flaky", "broken")]
+
+    results = feed_engine.fetch_feeds(urls, backoff=0)
+
+    assert results[urls[0]]["entries"] and results[urls[1]]["entries"]
+    assert results[urls[2]]["entries"] is None
+    assert results[urls[2]]["error"] == "ValueError: unexpected upstream payload"
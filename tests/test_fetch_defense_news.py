@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from benchmarks.stub_server import StubServer
+from fetchers import fetch_defense_news, news_store
+
+UNDATED_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>News</title>
+<item><title>Lockheed wins $450M radar contract</title><link>https://ex.com/undated</link></item>
+<item><link>https://ex.com/untitled</link><pubDate>Wed, 03 Sep 2025 19:29:05 GMT</pubDate></item>
+</channel></rss>"""
+ROUTES = {
+    "/rss/search": ("google_news.rss", "application/rss+xml"),
+    "/undated": (lambda path: UNDATED_RSS, "application/rss+xml"),
+}
+
+
+@pytest.fixture
+def feeds(tmp_path, monkeypatch):
+    """Points fetch_news at a stub server (which 404s outside /rss/search) and a scratch data dir."""
+    monkeypatch.chdir(tmp_path)
+    with StubServer(ROUTES) as server:
+        monkeypatch.setattr(fetch_defense_news, "feed_url", lambda query: f"{server.base_url}/{query}")
+        yield
+
+
+def test_some_failed_feeds_are_reported_but_not_fatal(feeds, capsys):
+    fetch_defense_news.fetch_news({"Lockheed Martin": "rss/search?q=lmt", "Gone": "missing"}, state={})
+
+    assert "1 failed" in capsys.readouterr().out
+
+
+def test_run_fails_when_every_feed_fails(feeds):
+    with pytest.raises(RuntimeError, match="All 2 news feeds failed"):
+        fetch_defense_news.fetch_news({"Lockheed Martin": "missing", "RTX": "missing"}, state={})
+
+
+def test_entries_without_a_date_or_title_are_stored(feeds):
+    fetch_defense_news.fetch_news({"Lockheed Martin": "undated"}, state={})
+
+    undated = pd.read_csv(f"{news_store.NEWS_DIR}/undated.csv", keep_default_na=False)
+    dated = pd.read_csv(f"{news_store.NEWS_DIR}/2025-09.csv", keep_default_na=False)
+    assert undated[["title", "published"]].values.tolist() == [["Lockheed wins $450M radar contract", ""]]
+    assert dated[["title", "link"]].values.tolist() == [["", "https://ex.com/untitled"]]
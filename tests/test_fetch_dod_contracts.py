@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+import requests
+
+from fetchers import registry
+from fetchers.contract_extract import build_name_lookup, extract_awards
+from fetchers.fetch_dod_contracts import COLUMNS, LISTING_URL, fetch_dod_contracts, parse_article, parse_listing
+from tests.helpers import read_fixture
+
+ARTICLE_URL = "https://www.defense.gov/News/Contracts/Contract/Article/{}/"
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves the listing fixture as page 1 and the article fixture for every announcement."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if url in self.failing:
+            raise requests.ConnectionError(url)
+        if url == LISTING_URL:
+            return FakeResponse(read_fixture("dod_contracts_listing.html"))
+        if "/Contract/Article/" in url:
+            return FakeResponse(read_fixture("dod_contract_article.html"))
+        return FakeResponse("<html><body></body></html>")
+
+
+def test_parse_listing():
+    items = parse_listing(read_fixture("dod_contracts_listing.html"))
+
+    assert [item["date"] for item in items] == ["2025-09-05", "2025-09-04", "2025-09-03", "2025-09-02", "2025-08-29"]
+    assert items[0] == {"date": "2025-09-05", "title": "Contracts For Sept. 5, 2025", "link": ARTICLE_URL.format(4293421)}
+
+
+def test_parse_article():
+    lines = parse_article(read_fixture("dod_contract_article.html")).split("\n")
+
+    assert lines[0] == "ARMY"
+    assert lines[1].startswith("Lockheed Martin Corp., Grand Prairie, Texas, was awarded a $9,796,463,800")
+    assert "NAVY" in lines and "AIR FORCE" in lines
+
+
+def test_extract_awards():
+    contracts = pd.DataFrame({
+        "date": ["2025-09-05"], "summary": [parse_article(read_fixture("dod_contract_article.html"))],
+        "link": [ARTICLE_URL.format(4293421)],
+    })
+    awards = extract_awards(contracts, build_name_lookup(registry.public_companies()))
+
+    assert awards["ticker"].tolist() == ["LMT", "OSK", "GD", "HII", "BA", "NOC", "LHX"]
+    lockheed = awards.iloc[0]
+    assert lockheed["agency"] == "Army"
+    assert lockheed["amount"] == 9_796_463_800
+    assert lockheed["contract_number"] == "W31P4Q-24-C-0020"
+    assert lockheed["completion_date"] == pd.Timestamp("2030-09-30")
+    assert lockheed["contracting_activity"] == "Army Contracting Command, Redstone Arsenal, Alabama"
+    # Month-only completion dates fall on the last day of that month
+    assert awards.iloc[2]["completion_date"] == pd.Timestamp("2029-06-30")
+
+
+def test_incremental_crawl_stops_at_high_water_mark(tmp_path):
+    path = tmp_path / "dod_contracts.csv"
+    stored = parse_listing(read_fixture("dod_contracts_listing.html"))[2:]
+    pd.DataFrame([{**item, "summary": ""} for item in stored], columns=COLUMNS).to_csv(path, index=False)
+    session = FakeSession()
+
+    fetch_dod_contracts(max_pages=5, workers=1, interval=0, path=str(path), session=session)
+
+    # Page 1 already reaches stored announcements, so no further page is requested and only
+    # the two new articles are fetched
+    assert session.urls[0] == LISTING_URL
+    assert sorted(session.urls[1:]) == [ARTICLE_URL.format(4292150), ARTICLE_URL.format(4293421)]
+    contracts = pd.read_csv(path)
+    assert contracts["date"].tolist() == ["2025-09-03", "2025-09-02", "2025-08-29", "2025-09-04", "2025-09-05"]
+    assert contracts["link"].is_unique
+
+
+@pytest.mark.parametrize("failing_page", [1, 2])
+def test_failed_listing_page_does_not_abort_run(tmp_path, failing_page):
+    path = tmp_path / "dod_contracts.csv"
+    failing = LISTING_URL if failing_page == 1 else f"{LISTING_URL}?Page=2"
+    session = FakeSession(failing=[failing])
+
+    fetch_dod_contracts(max_pages=2, workers=2, interval=0, path=str(path), session=session)
+
+    saved = pd.read_csv(path)
+    assert len(saved) == (0 if failing_page == 1 else 5)
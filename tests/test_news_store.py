@@ -0,0 +1,51 @@
+import pandas as pd
+
+from fetchers import news_store
+
+
+def story(title, link, published="Wed, 03 Sep 2025 19:29:05 GMT", company="Lockheed Martin"):
+    return {"company": company, "title": title, "link": link, "published": published}
+
+
+def write_untagged_partition(news_dir, items):
+    """A partition as stored before ingestion-time tagging: no tags or contract_value columns."""
+    df = pd.DataFrame(items, columns=news_store.FEED_COLUMNS)
+    df.insert(0, "id", [news_store.article_id(link, title) for link, title in zip(df["link"], df["title"])])
+    news_dir.mkdir(exist_ok=True)
+    df.to_csv(news_dir / "2025-08.csv", index=False)
+
+
+def test_untagged_partitions_are_tagged_next_to_tagged_ones(tmp_path):
+    write_untagged_partition(tmp_path, [story("Lockheed wins $450M missile contract", "https://ex.com/a",
+                                              "Fri, 29 Aug 2025 10:00:00 GMT")])
+    news_store.upsert_news([story("Quarterly results", "https://ex.com/b")], tmp_path)
+
+    news = news_store.load_news(tmp_path).set_index("link")
+
+    assert news.loc["https://ex.com/a", "tags"] == "missile;contract"
+    assert news.loc["https://ex.com/a", "contract_value"] == 450e6
+    assert news.loc["https://ex.com/b", "tags"] == ""
+
+
+def test_new_rows_in_an_untagged_partition_rewrite_it_tagged(tmp_path):
+    old = story("Old radar story", "https://ex.com/a", "Fri, 29 Aug 2025 10:00:00 GMT")
+    write_untagged_partition(tmp_path, [old])
+
+    written = news_store.upsert_news([old, story("New drone story", "https://ex.com/c",
+                                                 "Sat, 30 Aug 2025 10:00:00 GMT")], tmp_path)
+
+    partition = pd.read_csv(tmp_path / "2025-08.csv", keep_default_na=False)
+    assert written == 1
+    assert partition.columns.tolist() == news_store.COLUMNS
+    assert partition["tags"].tolist() == ["radar", "drone"]
+
+
+def test_story_matched_by_several_companies_is_stored_once(tmp_path):
+    items = [
+        story("Lockheed and Raytheon team up", "https://ex.com/a?oc=5", company="Lockheed Martin"),
+        story("Lockheed and Raytheon team up", "https://ex.com/a?oc=6", company="RTX"),
+    ]
+
+    assert news_store.upsert_news(items, tmp_path) == 1
+    assert news_store.upsert_news(items, tmp_path) == 0
+    assert news_store.load_news(tmp_path)["company"].tolist() == ["Lockheed Martin"]
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fetchers import news_tagging
+
+
+def test_tag_titles_matches_word_starts_in_keyword_order():
+    titles = pd.Series(["New shipbuilding CONTRACT for missiles", "Partnership announced", None])
+
+    assert news_tagging.tag_titles(titles).tolist() == ["missile;ship;contract", "", ""]
+
+
+@pytest.mark.parametrize("title, amount", [
+    ("Army awards $9.8 billion missile deal", 9.8e9),
+    ("Navy orders drones for $450M", 450e6),
+    ("Contract worth $1,234,567 signed", 1_234_567),
+    ("$2bn radar upgrade, then $5M more", 2e9),
+    ("$ 3 trillion budget", 3e12),
+    ("$5 Mobile app", 5),  # a unit letter only counts as a whole word
+])
+def test_extract_amounts(title, amount):
+    assert news_tagging.extract_amounts(pd.Series([title])).iloc[0] == pytest.approx(amount)
+
+
+def test_extract_amounts_without_a_dollar_figure():
+    assert np.isnan(news_tagging.extract_amounts(pd.Series(["9 million drones", None])).to_numpy()).all()
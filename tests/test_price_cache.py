@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from fetchers import price_cache
+
+
+def bars(dates, closes):
+    closes = pd.Series(closes, dtype="float64")
+    return pd.DataFrame({"Open": closes.values, "High": closes.values, "Low": closes.values, "Close": closes.values,
+                         "Volume": 1000.0}, index=pd.DatetimeIndex(dates, name="Date"))
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replaces the yfinance download with canned frames; records the keyword arguments of each call."""
+    calls = []
+    responses = {}
+
+    def fake_download(tickers, **kwargs):
+        calls.append((list(tickers), kwargs))
+        key = "max" if kwargs.get("period") == "max" else "since"
+        return {t: responses[key][t] for t in tickers if t in responses.get(key, {})}
+
+    monkeypatch.setattr(price_cache, "_download", fake_download)
+    return calls, responses
+
+
+def test_warm_refresh_appends_new_bars(tmp_path, downloads):
+    calls, responses = downloads
+    price_cache._write_history("LMT", bars(["2025-09-01", "2025-09-02", "2025-09-03"], [10, 11, 12]), tmp_path)
+    responses["since"] = {"LMT": bars(["2025-09-02", "2025-09-03", "2025-09-04"], [11, 12.5, 13])}
+
+    price_cache.refresh(["LMT"], tmp_path)
+
+    assert calls == [(["LMT"], {"start": "2025-09-02"})]
+    assert price_cache.read_history("LMT", tmp_path)["Close"].tolist() == [10, 11, 12.5, 13]
+
+
+def test_readjusted_history_is_downloaded_again(tmp_path, downloads):
+    calls, responses = downloads
+    price_cache._write_history("LMT", bars(["2025-09-01", "2025-09-02", "2025-09-03"], [200, 220, 240]), tmp_path)
+    # A 2:1 split halves every adjusted close, including the overlapping ones
+    responses["since"] = {"LMT": bars(["2025-09-02", "2025-09-03", "2025-09-04"], [110, 120, 125])}
+    responses["max"] = {"LMT": bars(["2025-09-01", "2025-09-02", "2025-09-03", "2025-09-04"], [100, 110, 120, 125])}
+
+    price_cache.refresh(["LMT"], tmp_path)
+
+    assert calls[-1] == (["LMT"], {"period": "max"})
+    assert price_cache.read_history("LMT", tmp_path)["Close"].tolist() == [100, 110, 120, 125]
+
+
+def test_ticker_without_data_is_not_downloaded_again_until_stale(tmp_path, downloads):
+    calls, _ = downloads
+
+    price_cache.refresh_stale(["DELISTED"], cache_dir=tmp_path)
+    price_cache.refresh_stale(["DELISTED"], cache_dir=tmp_path)
+
+    assert calls == [(["DELISTED"], {"period": "max"})]
+    assert price_cache.read_history("DELISTED", tmp_path).empty
+    assert price_cache.read_histories(["DELISTED"], "max", tmp_path) == {}
+
+    price_cache.refresh_stale(["DELISTED"], max_age=0, cache_dir=tmp_path)
+    assert len(calls) == 2
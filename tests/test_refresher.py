@@ -0,0 +1,24 @@
+from fetchers.refresher import Refresher
+
+
+def test_version_changes_with_every_new_result():
+    results = iter([[1], [1], RuntimeError("upstream down")])
+
+    def job():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    refresher = Refresher({"news": (job, 60)})
+    assert refresher.versioned("news") == (None, 0)
+
+    refresher.run_job("news")
+    first, first_version = refresher.versioned("news")
+    refresher.run_job("news")
+    second, second_version = refresher.versioned("news")
+    assert first == second and second_version == first_version + 1
+
+    # A failed run keeps the previous result, and so its version
+    refresher.run_job("news")
+    assert refresher.versioned("news") == (second, second_version)
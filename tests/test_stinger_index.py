@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from fetchers import stinger_index
+
+DATES = pd.bdate_range("2025-01-01", periods=3)
+
+
+def test_market_cap_weighting_converts_listings_to_usd():
+    closes = pd.DataFrame({"LMT": [100.0, 100.0, 110.0], "SAAB-B.ST": [400.0] * 3, "QQ.L": [300.0] * 3}, DATES)
+    market_caps = {"LMT": 100e9, "SAAB-B.ST": 1_000e9, "QQ.L": 80e9}  # USD, SEK, GBP
+    rates = pd.DataFrame({"SEK": [0.1] * 3, "GBP": [1.25] * 3}, DATES)
+
+    usd_closes, usd_caps = stinger_index.to_usd(closes, market_caps, rates)
+    level = stinger_index.compute_index(usd_closes, "market_cap", usd_caps)
+
+    assert stinger_index.fx_tickers(closes.columns) == {"GBP": "GBPUSD=X", "SEK": "SEKUSD=X"}
+    assert usd_caps.tolist() == pytest.approx([100e9, 100e9, 100e9])
+    # Three equal USD weights, one of which rose 10%: holdings of 300 vs 100e9 / 110 * 100 + 200e9
+    assert level.iloc[-1] == pytest.approx(100 * 300 / (100 / 1.1 + 200))
+
+
+def test_listings_without_a_rate_are_left_out():
+    closes = pd.DataFrame({"LMT": [100.0, 110.0], "KOG.OL": [50.0, 25.0]}, DATES[:2])
+    usd_closes, usd_caps = stinger_index.to_usd(closes, {"LMT": 1e9, "KOG.OL": 1e9}, pd.DataFrame())
+
+    assert stinger_index.compute_index(usd_closes, "market_cap", usd_caps).iloc[-1] == pytest.approx(110)